@@ -11,12 +11,18 @@ Date: 2026-02-04
 
 import sys
 import os
+import json
 import tempfile
 import hashlib
+import contextlib
+import subprocess
 
 # Add parent directory to path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
+# scripts/ 검증 모듈 경로 (스크립트 직접 테스트용)
+SCRIPTS_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))), "scripts")
+
 from server import (
     # Internal logic functions (testable)
     _validate_failure_mode_logic,
@@ -72,6 +78,154 @@ def test_failure_mode_fail_future_result():
     assert any(v["type"] == "FUTURE_RESULT_IN_E" for v in result["violations"])
     print("[O] test_failure_mode_fail_future_result: PASSED")
 
+def test_mapping_no_match_across_word_boundary():
+    """[PASS] scripts 기능-고장형태 매핑: 띄어쓰기 경계를 넘는 오탐 없음 ('일정 전압' != '정전')"""
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    from validate_function_failure_mapping import validate_failure_mode_mapping
+
+    assert validate_failure_mode_mapping("부족: 일정 전압 저하") == []
+    # 셀에 쓰인 표기 그대로 보고
+    issues = validate_failure_mode_mapping("과도: 온도상승")
+    assert [issue["pattern"] for issue in issues] == ["온도상승"]
+    print("[O] test_mapping_no_match_across_word_boundary: PASSED")
+
+def _import_lifecycle_coverage():
+    """scripts/validate_lifecycle_coverage 모듈 import"""
+    if SCRIPTS_DIR not in sys.path:
+        sys.path.insert(0, SCRIPTS_DIR)
+    import validate_lifecycle_coverage
+    return validate_lifecycle_coverage
+
+def _write_s_workbook(path, rows):
+    """FMEA 시트에 고장영향/S 헤더와 (고장영향, S) 행을 쓴 Excel 파일 생성"""
+    from openpyxl import Workbook
+    wb = Workbook()
+    ws = wb.active
+    ws.title = "FMEA"
+    ws.append(["고장영향", "S"])
+    for row in rows:
+        ws.append(list(row))
+    wb.save(path)
+
+def test_s_distribution_cache_misses_on_change():
+    """[PASS] S값 분포 결과 캐시: 파일이 바뀌면 캐시 미사용, 리더는 키에 포함, 환경 변수로 끄기"""
+    lc = _import_lifecycle_coverage()
+    saved_dir = lc._RESULT_CACHE_DIR
+    saved_env = os.environ.pop(lc._NO_CACHE_ENV, None)
+    try:
+        with tempfile.TemporaryDirectory() as tmp:
+            lc._RESULT_CACHE_DIR = lc.Path(tmp) / "cache"
+            path = os.path.join(tmp, "s.xlsx")
+
+            _write_s_workbook(path, [("조립 정밀도 저하", 4)])
+            first = lc.validate_s_distribution(path)
+            assert first["s_distribution"]["low"]["count"] == 1
+            assert len(os.listdir(lc._RESULT_CACHE_DIR)) == 1
+
+            # 리더가 다르면 다른 캐시 키
+            cache_path = lc._result_cache_path(path)
+            saved_reader = lc._SHEET_READER
+            lc._SHEET_READER = "other-reader"
+            try:
+                assert lc._result_cache_path(path) != cache_path
+            finally:
+                lc._SHEET_READER = saved_reader
+
+            _write_s_workbook(path, [("조립 정밀도 저하", 4), ("무부하 손실 초과", 6), ("절연 파괴", 9)])
+            second = lc.validate_s_distribution(path)
+            assert second["checked_rows"] == 3
+            assert second["s_distribution"]["high"]["count"] == 1
+            assert len(os.listdir(lc._RESULT_CACHE_DIR)) == 2
+
+            # FMEA_VALIDATE_NO_CACHE 설정 시 캐시를 읽지도 쓰지도 않음
+            os.environ[lc._NO_CACHE_ENV] = "1"
+            _write_s_workbook(path, [("무부하 손실 초과", 6)])
+            third = lc.validate_s_distribution(path)
+            assert third["checked_rows"] == 1
+            assert len(os.listdir(lc._RESULT_CACHE_DIR)) == 2
+    finally:
+        lc._RESULT_CACHE_DIR = saved_dir
+        os.environ.pop(lc._NO_CACHE_ENV, None)
+        if saved_env is not None:
+            os.environ[lc._NO_CACHE_ENV] = saved_env
+    print("[O] test_s_distribution_cache_misses_on_change: PASSED")
+
+_S_PASS_ROWS = [("조립 정밀도 저하", 4), ("무부하 손실 초과", 6), ("절연 파괴", 9)]
+
+@contextlib.contextmanager
+def _no_result_cache(lc):
+    """S값 분포 결과 캐시 끄기 (~/.cache에 테스트 결과를 남기지 않음)"""
+    saved_env = os.environ.get(lc._NO_CACHE_ENV)
+    os.environ[lc._NO_CACHE_ENV] = "1"
+    try:
+        yield
+    finally:
+        if saved_env is None:
+            os.environ.pop(lc._NO_CACHE_ENV, None)
+        else:
+            os.environ[lc._NO_CACHE_ENV] = saved_env
+
+def test_s_distribution_directory_worst_status():
+    """[PASS] 폴더 검증: 파일별 결과 중 가장 심각한 상태로 집계 (error > warning > pass)"""
+    lc = _import_lifecycle_coverage()
+    with _no_result_cache(lc), tempfile.TemporaryDirectory() as tmp:
+        _write_s_workbook(os.path.join(tmp, "a_pass.xlsx"), _S_PASS_ROWS)
+        _write_s_workbook(os.path.join(tmp, "b_warning.xlsx"), [("조립 정밀도 저하", 4)])
+
+        result = lc.validate_directory(tmp)
+        assert result["file_count"] == 2
+        assert result["files"]["a_pass.xlsx"]["status"] == "pass"
+        assert result["files"]["b_warning.xlsx"]["status"] == "warning"
+        assert result["status"] == "warning"
+
+        # 고장영향 헤더가 없는 파일 -> error가 우선
+        from openpyxl import Workbook
+        wb = Workbook()
+        wb.active.title = "FMEA"
+        wb.active.append(["항목", "S"])
+        wb.save(os.path.join(tmp, "c_error.xlsx"))
+
+        result = lc.validate_directory(tmp)
+        assert result["file_count"] == 3
+        assert result["status"] == "error"
+    print("[O] test_s_distribution_directory_worst_status: PASSED")
+
+def test_s_distribution_empty_directory_error():
+    """[FAIL] 폴더 검증: *.xlsx가 없는 폴더는 통과가 아닌 error (CLI exit code 1)"""
+    lc = _import_lifecycle_coverage()
+    with tempfile.TemporaryDirectory() as tmp:
+        result = lc.validate_directory(tmp)
+        assert result["status"] == "error"
+        assert result["file_count"] == 0
+        assert "message" in result
+
+        proc = subprocess.run(
+            [sys.executable, os.path.join(SCRIPTS_DIR, "validate_lifecycle_coverage.py"), tmp, "--json-only"],
+            capture_output=True, text=True, encoding="utf-8"
+        )
+        assert proc.returncode == 1
+        # --json-only: 보고서 없이 JSON만 출력
+        assert json.loads(proc.stdout)["status"] == "error"
+    print("[O] test_s_distribution_empty_directory_error: PASSED")
+
+def test_s_distribution_discovery_issue_count():
+    """[PASS] 발견 장소 이슈: 전체 건수는 discovery_location_issue_count, 목록은 앞쪽 일부만 보관"""
+    lc = _import_lifecycle_coverage()
+    with _no_result_cache(lc), tempfile.TemporaryDirectory() as tmp:
+        path = os.path.join(tmp, "issues.xlsx")
+        issue_rows = [(f"조립 불합격 {i}", 4) for i in range(lc._MAX_DISCOVERY_ISSUES + 2)]
+        _write_s_workbook(path, _S_PASS_ROWS + issue_rows)
+
+        result = lc.validate_s_distribution(path)
+        assert result["status"] == "warning"
+        assert result["discovery_location_issue_count"] == len(issue_rows)
+        assert len(result["discovery_location_issues"]) == lc._MAX_DISCOVERY_ISSUES
+        # 보관 목록은 발견 순서의 앞쪽 행
+        assert [issue["row"] for issue in result["discovery_location_issues"]] == \
+            list(range(len(_S_PASS_ROWS) + 2, len(_S_PASS_ROWS) + 2 + lc._MAX_DISCOVERY_ISSUES))
+    print("[O] test_s_distribution_discovery_issue_count: PASSED")
+
 # ============================================================
 # Test: fmea_validate_effect (C Column)
 # ============================================================
@@ -274,6 +428,12 @@ def run_all_tests():
         test_failure_mode_fail_mechanism_word,
         test_failure_mode_fail_measurement_word,
         test_failure_mode_fail_future_result,
+        test_mapping_no_match_across_word_boundary,
+        # S값 분포 (validate_lifecycle_coverage)
+        test_s_distribution_cache_misses_on_change,
+        test_s_distribution_directory_worst_status,
+        test_s_distribution_empty_directory_error,
+        test_s_distribution_discovery_issue_count,
         # C Column
         test_effect_pass,
         test_effect_fail_physical_state,
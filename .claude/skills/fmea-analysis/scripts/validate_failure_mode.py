@@ -4,7 +4,7 @@
 FMEA Excel 생성 시 GATE 4에서 사용
 
 사용법:
-    python validate_failure_mode.py <excel_file>
+    python validate_failure_mode.py <excel_file> [--no-json] [--stream]
     python validate_failure_mode.py 철심_FMEA.xlsx
 
 반환:
@@ -18,19 +18,118 @@ FMEA Excel 생성 시 GATE 4에서 사용
 
 import sys
 import io
-import json
+import argparse
 import re
 import pandas as pd
+from openpyxl import load_workbook
 from pathlib import Path
-from typing import Tuple
+from collections import namedtuple
+from functools import lru_cache
+from multiprocessing import Pool, cpu_count
+from typing import Iterable, Iterator, Optional, Tuple
 
 # Windows cp949 인코딩 문제 해결 (공통 모듈 사용)
 from encoding_utils import setup_encoding
 setup_encoding()
 
+from validation_utils import dumps_json, load_pickle_cache, save_pickle_cache
+
+# Hyperscan (선택): 설치 시 다중 키워드 스캔을 SIMD 엔진으로 수행
+try:
+    import hyperscan
+except ImportError:
+    hyperscan = None
+
 # 스크립트 디렉토리
 script_dir = Path(__file__).parent
 
+# 온톨로지 마크다운 마커
+_SECTION_PREFIX = '## SECTION:'
+_TAG_PREFIX = '### TAG:'
+
+# '---' 종료 마커 이후 내용을 무시하는 섹션
+_SECTIONS_WITH_END_MARKER = frozenset({
+    'MECHANISM_KEYWORDS', 'VISIBLE_PHENOMENA', 'VISIBILITY_RULE', 'ABSTRACT_TO_VISIBLE_MAP'
+})
+
+
+def _split_keywords(text: str) -> list:
+    """쉼표로 구분된 키워드 문자열을 리스트로 변환 (빈 항목 제외)"""
+    return [k.strip() for k in text.split(',') if k.strip()]
+
+
+# 태그별 허용/금지 키워드 규칙
+TagRules = namedtuple('TagRules', 'allowed forbidden')
+
+# 온톨로지 '허용:'/'금지:' 접두어 -> TagRules 필드
+_TAG_RULE_FIELDS = {'허용': 'allowed', '금지': 'forbidden'}
+
+# 파싱 결과/캐시 구조가 바뀌면 증가 (기존 캐시 무효화)
+_ONTOLOGY_CACHE_VERSION = 5
+
+
+def _build_reasons(ontology: dict) -> dict:
+    """
+    키워드별 위반 사유 문자열 사전 생성
+
+    같은 키워드를 위반하는 행이 많아도 사유 문자열은 키워드당 1개만 유지
+    (행마다 f-string 생성 회피, sys.intern으로 중복 제거)
+    """
+    def reason_map(keywords, template):
+        return {kw: sys.intern(template.format(kw)) for kw in keywords}
+
+    return {
+        'exception': reason_map(ontology.get('allowed_exceptions', []), "허용 예외: {}"),
+        'forbidden_exact': reason_map(
+            ontology.get('forbidden_exact', []),
+            "금지어 포함: '{}' (미래결과/측정값 -> C열 또는 G열로 이동)"
+        ),
+        'forbidden_pattern': reason_map(
+            ontology.get('forbidden_patterns', []),
+            "금지 패턴 포함: '{}' (측정값/추상적 표현)"
+        ),
+        'mechanism': reason_map(
+            ontology.get('mechanism_keywords', []),
+            "[BLOCKING] '{}'은 메커니즘(과정)! E열(현재 현상) -> G열(메커니즘)로 이동"
+        ),
+        'abstract': {
+            abstract: sys.intern(
+                f"[X] '{abstract}'는 측정 필요한 추상적 개념 -> '{', '.join(suggestions[:3])}' 등 구체적 현상으로 대체"
+            )
+            for abstract, suggestions in ontology.get('abstract_to_visible', {}).items()
+        },
+        'tag': {
+            (tag, kw): sys.intern(f"[X] '{tag}'에 '{kw}' 부적합 - 태그 재검토 필요")
+            for tag, rules in ontology.get('tag_keyword_map', {}).items()
+            for kw in rules.forbidden
+        },
+    }
+
+
+def _load_ontology_cache(ontology_path: Path, cache_path: Path) -> Optional[dict]:
+    """
+    온톨로지 파싱 캐시 로드 (원본 mtime_ns/크기가 저장 당시와 다르거나 손상 시 None)
+    """
+    cached = load_pickle_cache(ontology_path, cache_path, _ONTOLOGY_CACHE_VERSION)
+    if cached is None:
+        return None
+
+    cached['tag_keyword_map'] = {tag: TagRules(*rules) for tag, rules in cached['tag_keyword_map'].items()}
+    return cached
+
+
+def _save_ontology_cache(ontology_path: Path, cache_path: Path, result: dict):
+    """
+    온톨로지 파싱 결과를 캐시 파일로 저장 (쓰기 실패 시 무시)
+
+    TagRules는 (allowed, forbidden) 튜플로 저장 - namedtuple 클래스 경로가 실행 방식에 따라
+    __main__/validate_failure_mode로 달라져 캐시가 흔들리므로 로드 시 TagRules로 복원
+    위반 사유 문자열은 코드의 템플릿에서 만들어지므로 저장하지 않고 로드 후 재생성
+    """
+    plain = dict(result, tag_keyword_map={tag: tuple(rules) for tag, rules in result['tag_keyword_map'].items()})
+    del plain['reasons']
+    save_pickle_cache(ontology_path, cache_path, _ONTOLOGY_CACHE_VERSION, plain)
+
 
 def load_failure_mode_ontology() -> dict:
     """
@@ -50,7 +149,7 @@ def load_failure_mode_ontology() -> dict:
             'forbidden_exact': [...],     # 정확 일치 금지어
             'allowed_exceptions': [...],  # 허용 예외
             'required_tags': [...],       # 필수 태그
-            'tag_keyword_map': {...}      # 태그별 허용/금지 매핑
+            'tag_keyword_map': {...}      # 태그별 TagRules(allowed, forbidden)
         }
     """
     ontology_path = script_dir.parent / "references" / "failure-mode-ontology.md"
@@ -64,125 +163,105 @@ def load_failure_mode_ontology() -> dict:
         'mechanism_keywords': [],  # 메커니즘 용어 (G열로 이동 필요)
         'visible_phenomena': [],   # 눈에 보이는 현상 (허용 목록)
         'abstract_to_visible': {}, # 추상적 개념 -> 구체적 현상 변환 매핑
-        'visibility_rule': {}      # 눈에 보이는 현상 검증 규칙
+        'visibility_rule': {},     # 눈에 보이는 현상 검증 규칙
+        'reasons': _build_reasons({})  # 키워드별 위반 사유 문자열 (사전 생성)
     }
 
     if not ontology_path.exists():
         print(f"[WARNING] 온톨로지 파일 없음: {ontology_path}")
         return result
 
+    # 파싱 캐시: 온톨로지 파일의 mtime/크기가 그대로면 재사용
+    cache_path = ontology_path.with_suffix('.md.pkl')
+    cached = _load_ontology_cache(ontology_path, cache_path)
+    if cached is not None:
+        cached['reasons'] = _build_reasons(cached)
+        return cached
+
     content = ontology_path.read_text(encoding='utf-8')
 
-    # SECTION 기반 파싱
-    sections = re.split(r'\n## SECTION:', content)
+    def add_category_keywords(key: str, line: str, stripped: str):
+        # "카테고리: 키워드1, 키워드2" 형식
+        if ':' in line and not line.startswith('#'):
+            result[key].extend(_split_keywords(line.partition(':')[2]))
+
+    def add_plain_keywords(key: str, line: str, stripped: str):
+        # "키워드1, 키워드2" 형식 (카테고리 없음)
+        if stripped and not line.startswith('#'):
+            result[key].extend(_split_keywords(line))
+
+    def add_mechanism_keywords(line: str, stripped: str):
+        # 키워드 라인만 파싱 (마크다운 리스트, 헤더, blockquote, 테이블 제외)
+        if ':' in line and not stripped.startswith(('#', '-', '>', '|')):
+            result['mechanism_keywords'].extend(_split_keywords(line.partition(':')[2]))
+
+    def add_visibility_rule(line: str, stripped: str):
+        if ':' in line and not line.startswith('#'):
+            key, _, value = line.partition(':')
+            result['visibility_rule'][key.strip()] = value.strip()
+
+    def add_abstract_to_visible(line: str, stripped: str):
+        if ':' in line and not line.startswith('#'):
+            abstract, _, visibles = line.partition(':')
+            result['abstract_to_visible'][abstract.strip()] = _split_keywords(visibles)
+
+    section_handlers = {
+        'FORBIDDEN_PATTERNS': lambda line, stripped: add_category_keywords('forbidden_patterns', line, stripped),
+        'FORBIDDEN_EXACT': lambda line, stripped: add_category_keywords('forbidden_exact', line, stripped),
+        'ALLOWED_EXCEPTIONS': lambda line, stripped: add_plain_keywords('allowed_exceptions', line, stripped),
+        'REQUIRED_TAGS': lambda line, stripped: add_plain_keywords('required_tags', line, stripped),
+        # MECHANISM_KEYWORDS (메커니즘 용어 - G열로 이동 필요)
+        'MECHANISM_KEYWORDS': add_mechanism_keywords,
+        # VISIBLE_PHENOMENA (눈에 보이는 현상 목록)
+        'VISIBLE_PHENOMENA': lambda line, stripped: add_category_keywords('visible_phenomena', line, stripped),
+        # VISIBILITY_RULE (눈에 보이는 현상 검증 규칙)
+        'VISIBILITY_RULE': add_visibility_rule,
+        # ABSTRACT_TO_VISIBLE_MAP (추상적 개념 -> 구체적 현상 변환)
+        'ABSTRACT_TO_VISIBLE_MAP': add_abstract_to_visible,
+    }
 
-    for section in sections:
-        lines = section.strip().split('\n')
-        if not lines:
-            continue
+    # SECTION 기반 단일 패스 파싱 (줄 단위 상태 머신)
+    current_section = None
+    current_tag = None
+    section_closed = False
 
-        section_name = lines[0].strip()
-
-        # FORBIDDEN_PATTERNS
-        if section_name == 'FORBIDDEN_PATTERNS':
-            for line in lines[1:]:
-                if ':' in line and not line.startswith('#'):
-                    _, keywords = line.split(':', 1)
-                    result['forbidden_patterns'].extend(
-                        [k.strip() for k in keywords.split(',') if k.strip()]
-                    )
-
-        # FORBIDDEN_EXACT
-        elif section_name == 'FORBIDDEN_EXACT':
-            for line in lines[1:]:
-                if ':' in line and not line.startswith('#'):
-                    _, keywords = line.split(':', 1)
-                    result['forbidden_exact'].extend(
-                        [k.strip() for k in keywords.split(',') if k.strip()]
-                    )
-
-        # ALLOWED_EXCEPTIONS
-        elif section_name == 'ALLOWED_EXCEPTIONS':
-            for line in lines[1:]:
-                if line.strip() and not line.startswith('#'):
-                    result['allowed_exceptions'].extend(
-                        [k.strip() for k in line.split(',') if k.strip()]
-                    )
-
-        # REQUIRED_TAGS
-        elif section_name == 'REQUIRED_TAGS':
-            for line in lines[1:]:
-                if line.strip() and not line.startswith('#'):
-                    result['required_tags'].extend(
-                        [k.strip() for k in line.split(',') if k.strip()]
-                    )
-
-        # TAG_KEYWORD_MAP
-        elif section_name == 'TAG_KEYWORD_MAP':
+    for line in content.splitlines():
+        if line.startswith(_SECTION_PREFIX):
+            current_section = line[len(_SECTION_PREFIX):].strip()
             current_tag = None
-            for line in lines[1:]:
-                # ### TAG:<태그명> 형식
-                tag_match = re.match(r'### TAG:(.+)', line)
-                if tag_match:
-                    current_tag = tag_match.group(1).strip()
-                    result['tag_keyword_map'][current_tag] = {'허용': [], '금지': []}
-                elif current_tag and ':' in line:
-                    if line.startswith('허용:'):
-                        _, keywords = line.split(':', 1)
-                        result['tag_keyword_map'][current_tag]['허용'] = [
-                            k.strip() for k in keywords.split(',') if k.strip()
-                        ]
-                    elif line.startswith('금지:'):
-                        _, keywords = line.split(':', 1)
-                        result['tag_keyword_map'][current_tag]['금지'] = [
-                            k.strip() for k in keywords.split(',') if k.strip()
-                        ]
+            section_closed = False
+            continue
 
-        # MECHANISM_KEYWORDS (메커니즘 용어 - G열로 이동 필요)
-        elif section_name == 'MECHANISM_KEYWORDS':
-            for line in lines[1:]:
-                # 섹션 종료 마커에서 중단
-                if line.strip().startswith('---'):
-                    break
-                # 키워드 라인만 파싱 (마크다운 리스트, 헤더, blockquote 제외)
-                stripped = line.strip()
-                if ':' in line and not stripped.startswith('#') and not stripped.startswith('-') and not stripped.startswith('>') and not stripped.startswith('|'):
-                    _, keywords = line.split(':', 1)
-                    result['mechanism_keywords'].extend(
-                        [k.strip() for k in keywords.split(',') if k.strip()]
-                    )
+        if current_section is None or section_closed:
+            continue
 
-        # VISIBLE_PHENOMENA (눈에 보이는 현상 목록)
-        elif section_name == 'VISIBLE_PHENOMENA':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    _, keywords = line.split(':', 1)
-                    result['visible_phenomena'].extend(
-                        [k.strip() for k in keywords.split(',') if k.strip()]
-                    )
+        stripped = line.strip()
 
-        # VISIBILITY_RULE (눈에 보이는 현상 검증 규칙)
-        elif section_name == 'VISIBILITY_RULE':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    key, value = line.split(':', 1)
-                    result['visibility_rule'][key.strip()] = value.strip()
+        # 섹션 종료 마커에서 중단
+        if current_section in _SECTIONS_WITH_END_MARKER and stripped.startswith('---'):
+            section_closed = True
+            continue
 
-        # ABSTRACT_TO_VISIBLE_MAP (추상적 개념 -> 구체적 현상 변환)
-        elif section_name == 'ABSTRACT_TO_VISIBLE_MAP':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    abstract, visibles = line.split(':', 1)
-                    result['abstract_to_visible'][abstract.strip()] = [
-                        v.strip() for v in visibles.split(',') if v.strip()
-                    ]
+        # TAG_KEYWORD_MAP: ### TAG:<태그명> 하위에 허용:/금지: 라인
+        if current_section == 'TAG_KEYWORD_MAP':
+            if line.startswith(_TAG_PREFIX):
+                current_tag = line[len(_TAG_PREFIX):].strip()
+                result['tag_keyword_map'][current_tag] = TagRules(allowed=[], forbidden=[])
+            elif current_tag and line.startswith(('허용:', '금지:')):
+                key, _, keywords = line.partition(':')
+                rules = result['tag_keyword_map'][current_tag]
+                result['tag_keyword_map'][current_tag] = rules._replace(
+                    **{_TAG_RULE_FIELDS[key]: _split_keywords(keywords)}
+                )
+            continue
 
+        handler = section_handlers.get(current_section)
+        if handler:
+            handler(line, stripped)
+
+    result['reasons'] = _build_reasons(result)
+
+    _save_ontology_cache(ontology_path, cache_path, result)
     return result
 
 
@@ -199,6 +278,119 @@ MECHANISM_KEYWORDS = _ontology['mechanism_keywords']
 VISIBLE_PHENOMENA = _ontology['visible_phenomena']
 ABSTRACT_TO_VISIBLE = _ontology['abstract_to_visible']
 VISIBILITY_RULE = _ontology['visibility_rule']
+REASONS = _ontology['reasons']
+
+
+def _compile_keyword_pattern(keywords: list) -> Optional[re.Pattern]:
+    """
+    키워드 목록을 단일 alternation 정규식으로 컴파일
+
+    같은 위치에서 긴 키워드가 우선 매칭되도록 길이 역순 정렬
+    키워드가 없으면 None (빈 alternation은 모든 문자열에 매칭되므로)
+    """
+    if not keywords:
+        return None
+    return re.compile('|'.join(map(re.escape, sorted(keywords, key=len, reverse=True))))
+
+
+# 태그 탐지 정규식 (부족:|과도:|유해:) - 1회 스캔으로 존재 여부와 위치 확인
+_TAG_RE = _compile_keyword_pattern(REQUIRED_TAGS)
+
+# 검증 키워드 그룹별 alternation 정규식 (hyperscan 미사용 시 fail-fast 게이트)
+# 중첩 수량자 없는 평면 alternation이므로 1회 전방 스캔으로 매칭 여부 판정
+_TAG_FORBIDDEN_KEYWORDS = [kw for rules in TAG_KEYWORD_MAP.values() for kw in rules.forbidden]
+
+_FORBIDDEN_RE = _compile_keyword_pattern(FORBIDDEN_EXACT + FORBIDDEN_PATTERNS)
+_EXCEPTION_RE = _compile_keyword_pattern(ALLOWED_EXCEPTIONS)
+_TAG_FORBIDDEN_RE = _compile_keyword_pattern(_TAG_FORBIDDEN_KEYWORDS)
+_MECHANISM_RE = _compile_keyword_pattern(MECHANISM_KEYWORDS)
+_ABSTRACT_RE = _compile_keyword_pattern(list(ABSTRACT_TO_VISIBLE))
+
+_KEYWORD_GROUPS = [
+    (pattern, keywords)
+    for pattern, keywords in [
+        (_FORBIDDEN_RE, FORBIDDEN_EXACT + FORBIDDEN_PATTERNS),
+        (_EXCEPTION_RE, ALLOWED_EXCEPTIONS),
+        (_TAG_FORBIDDEN_RE, _TAG_FORBIDDEN_KEYWORDS),
+        (_MECHANISM_RE, MECHANISM_KEYWORDS),
+        (_ABSTRACT_RE, list(ABSTRACT_TO_VISIBLE)),
+    ]
+    if pattern is not None
+]
+
+# 다중 키워드 스캔 대상: 셀 검증에 쓰이는 모든 키워드의 합집합
+_SCAN_KEYWORDS = sorted({kw for _, keywords in _KEYWORD_GROUPS for kw in keywords})
+
+
+def _build_hyperscan_db(keywords: list):
+    """
+    키워드 목록을 Hyperscan block 모드 DB로 컴파일
+
+    hyperscan 미설치(비 x86 등) 또는 컴파일 실패 시 None -> 순수 Python 스캔 사용
+    """
+    if hyperscan is None or not keywords:
+        return None
+    try:
+        db = hyperscan.Database()
+        db.compile(
+            expressions=[re.escape(k).encode('utf-8') for k in keywords],
+            ids=list(range(len(keywords))),
+            elements=len(keywords),
+            flags=[hyperscan.HS_FLAG_UTF8] * len(keywords),
+        )
+    except hyperscan.error:
+        return None
+    return db
+
+
+_HYPERSCAN_DB = _build_hyperscan_db(_SCAN_KEYWORDS)
+
+
+def _on_hyperscan_match(match_id, start, end, flags, context):
+    context.add(match_id)
+
+
+@lru_cache(maxsize=8192)
+def _keywords_in(text: str) -> frozenset:
+    """
+    text에 부분 문자열로 포함된 검증 키워드 집합 (중첩 매칭 포함)
+
+    각 검증 함수는 키워드 목록 순서대로 이 집합을 조회하므로
+    목록별 부분 문자열 검색이 문자열당 1회 스캔으로 대체됨
+    """
+    if _HYPERSCAN_DB is not None:
+        match_ids = set()
+        _HYPERSCAN_DB.scan(text.encode('utf-8'), match_event_handler=_on_hyperscan_match, context=match_ids)
+        return frozenset(_SCAN_KEYWORDS[i] for i in match_ids)
+
+    # 그룹 정규식이 매칭된 그룹만 개별 키워드 확인 (중첩 매칭 포함)
+    found = set()
+    for pattern, keywords in _KEYWORD_GROUPS:
+        if pattern.search(text):
+            found.update(k for k in keywords if k in text)
+    return frozenset(found)
+
+
+def _cell_text(value) -> str:
+    """
+    셀 값을 앞뒤 공백 제거 문자열로 변환 (None/NaN은 빈 문자열)
+
+    str/None/float 순으로 타입 확인 - pd.isna 디스패치와 중복 strip 회피
+    """
+    if isinstance(value, str):
+        return value.strip()
+    if value is None or value is pd.NA or (isinstance(value, float) and value != value):
+        return ''
+    return str(value).strip()
+
+
+def _is_empty(value) -> bool:
+    """None/NaN/공백 문자열 여부"""
+    return not _cell_text(value)
+
+
+# 메인 내용 끝의 괄호 설명 "(...)" 패턴
+_TRAILING_PAREN = re.compile(r'\([^)]*\)$')
 
 
 def extract_main_content(value: str) -> str:
@@ -208,27 +400,45 @@ def extract_main_content(value: str) -> str:
     예: "부족: 이완\n(철심 판의 누적 팽창으로 조립 불안정)" -> "부족: 이완"
     예: "부족: 이완(설명)" -> "부족: 이완"
     """
-    if pd.isna(value) or str(value).strip() == '':
+    value_str = _cell_text(value)
+    if not value_str:
         return ''
 
-    value_str = str(value).strip()
+    # 동일 셀 값이 검증 함수마다 반복 전달되므로 문자열 변환 후 캐시 조회
+    return _extract_main_content_cached(value_str)
 
+
+@lru_cache(maxsize=8192)
+def _extract_main_content_cached(value_str: str) -> str:
     # 줄바꿈이 있으면 첫 줄만 추출
     if '\n' in value_str:
         value_str = value_str.split('\n')[0].strip()
 
     # 괄호 안 내용 제거 (마지막 괄호만 - 메인 내용 뒤의 설명)
     # "부족: 이완(설명)" -> "부족: 이완"
-    import re
     # 콜론 뒤의 내용에서 괄호 제거
     if ':' in value_str:
         tag_part, content_part = value_str.split(':', 1)
-        content_part = re.sub(r'\([^)]*\)$', '', content_part).strip()
+        content_part = _TRAILING_PAREN.sub('', content_part).strip()
         value_str = f"{tag_part}: {content_part}"
 
     return value_str
 
 
+@lru_cache(maxsize=8192)
+def _split_tag(value_str: str) -> Tuple[Optional[str], str]:
+    """
+    메인 내용에서 태그와 태그 뒤 내용 분리
+
+    예: "부족: 이완" -> ("부족:", "이완")
+    태그가 없으면 (None, value_str)
+    """
+    m = _TAG_RE.search(value_str) if _TAG_RE else None
+    if m is None:
+        return None, value_str
+    return m.group(0), value_str[m.end():].strip()
+
+
 def validate_failure_mode(value: str) -> Tuple[bool, str]:
     """
     단일 고장형태 값 검증
@@ -237,29 +447,43 @@ def validate_failure_mode(value: str) -> Tuple[bool, str]:
     Returns:
         (is_valid, reason)
     """
-    if pd.isna(value) or str(value).strip() == '':
-        return True, "빈 값"
-
-    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증
+    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증 (빈 값/NaN은 '')
     value_str = extract_main_content(value)
 
     if not value_str:
         return True, "빈 값"
 
+    return _check_forbidden(value_str)
+
+
+def _check_forbidden(value_str: str) -> Tuple[bool, str]:
+    """금지어/금지 패턴 검사 (메인 내용 기준)"""
+    # 금지어 자체와 정확히 일치하는 값은 미리 계산된 결과 사용 (O(1))
+    exact_result = _FORBIDDEN_EXACT_RESULTS.get(value_str)
+    if exact_result is not None:
+        return exact_result
+
+    return _scan_forbidden(value_str)
+
+
+def _scan_forbidden(value_str: str) -> Tuple[bool, str]:
+    """예외/정확 일치 금지어/금지 패턴을 목록 순서대로 검사"""
+    found = _keywords_in(value_str)
+
     # 예외 항목은 통과
     for exception in ALLOWED_EXCEPTIONS:
-        if exception in value_str:
-            return True, f"허용 예외: {exception}"
+        if exception in found:
+            return True, REASONS['exception'][exception]
 
     # 정확히 일치하는 금지어 검사
     for forbidden in FORBIDDEN_EXACT:
-        if forbidden == value_str or forbidden in value_str:
-            return False, f"금지어 포함: '{forbidden}' (미래결과/측정값 -> C열 또는 G열로 이동)"
+        if forbidden in found:
+            return False, REASONS['forbidden_exact'][forbidden]
 
     # 패턴 일치 검사
     for pattern in FORBIDDEN_PATTERNS:
-        if pattern in value_str:
-            return False, f"금지 패턴 포함: '{pattern}' (측정값/추상적 표현)"
+        if pattern in found:
+            return False, REASONS['forbidden_pattern'][pattern]
 
     return True, "OK"
 
@@ -269,16 +493,25 @@ def validate_tag_format(value: str) -> Tuple[bool, str]:
     태그 형식 검증 (부족:/과도:/유해: 중 하나 필수)
     옵션 A 형식 지원: 괄호 안 설명은 검증 대상에서 제외
     """
-    if pd.isna(value) or str(value).strip() == '':
-        return True, "빈 값"
-
-    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증
+    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증 (빈 값/NaN은 '')
     value_str = extract_main_content(value)
 
     if not value_str:
         return True, "빈 값"
 
-    if not any(tag in value_str for tag in REQUIRED_TAGS):
+    tag, _ = _split_tag(value_str)
+    return _check_tag_format(tag)
+
+
+# 정확 일치 금지어별 _check_forbidden 결과
+# (금지어 문자열이 다른 금지어/예외를 포함할 수 있으므로 일반 경로 결과를 그대로 보관)
+FORBIDDEN_EXACT_SET = frozenset(FORBIDDEN_EXACT)
+_FORBIDDEN_EXACT_RESULTS = {word: _scan_forbidden(word) for word in FORBIDDEN_EXACT_SET}
+
+
+def _check_tag_format(tag: Optional[str]) -> Tuple[bool, str]:
+    """태그 존재 여부 검사"""
+    if tag is None:
         return False, "태그 없음: 부족:/과도:/유해: 중 하나 필수"
 
     return True, "OK"
@@ -289,24 +522,19 @@ def validate_tag_content_relation(value: str) -> Tuple[bool, str]:
     태그-내용 인과관계 검증
     옵션 A 형식 지원: 괄호 안 설명은 검증 대상에서 제외
     """
-    if pd.isna(value) or str(value).strip() == '':
-        return True, "빈 값"
-
-    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증
+    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증 (빈 값/NaN은 '')
     value_str = extract_main_content(value)
 
     if not value_str:
         return True, "빈 값"
 
     # 태그 추출
-    tag = None
-    content = value_str
-    for t in REQUIRED_TAGS:
-        if t in value_str:
-            tag = t
-            content = value_str.split(t, 1)[1].strip() if t in value_str else value_str
-            break
+    tag, content = _split_tag(value_str)
+    return _check_tag_content_relation(tag, content)
 
+
+def _check_tag_content_relation(tag: Optional[str], content: str) -> Tuple[bool, str]:
+    """태그별 금지 키워드 검사"""
     if tag is None:
         return True, "태그 없음 (별도 검증)"
 
@@ -314,11 +542,12 @@ def validate_tag_content_relation(value: str) -> Tuple[bool, str]:
         return True, "알 수 없는 태그"
 
     rules = TAG_KEYWORD_MAP[tag]
+    found = _keywords_in(content)
 
     # 금지 키워드 체크
-    for forbidden in rules['금지']:
-        if forbidden in content:
-            return False, f"[X] '{tag}'에 '{forbidden}' 부적합 - 태그 재검토 필요"
+    for forbidden in rules.forbidden:
+        if forbidden in found:
+            return False, REASONS['tag'][(tag, forbidden)]
 
     return True, "OK"
 
@@ -334,40 +563,32 @@ def validate_visibility(value: str) -> Tuple[bool, str]:
     Returns:
         (is_valid, reason)
     """
-    if pd.isna(value) or str(value).strip() == '':
-        return True, "빈 값"
-
-    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증
+    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증 (빈 값/NaN은 '')
     value_str = extract_main_content(value)
 
     if not value_str:
         return True, "빈 값"
 
     # 태그 제거 후 내용만 검사
-    content = value_str
-    for tag in REQUIRED_TAGS:
-        if tag in value_str:
-            content = value_str.split(tag, 1)[1].strip()
-            break
+    _, content = _split_tag(value_str)
+    return _check_visibility(content)
+
+
+def _check_visibility(content: str) -> Tuple[bool, str]:
+    """추상적 개념 검사 (태그 제거된 내용 기준)"""
+    found = _keywords_in(content)
 
     # 허용 예외 항목은 통과
     for exception in ALLOWED_EXCEPTIONS:
-        if exception in content:
-            return True, f"허용 예외: {exception}"
+        if exception in found:
+            return True, REASONS['exception'][exception]
 
     # 추상적 개념 체크 (ABSTRACT_TO_VISIBLE 매핑에 있는 키)
     for abstract in ABSTRACT_TO_VISIBLE.keys():
-        if abstract in content:
-            suggestions = ABSTRACT_TO_VISIBLE[abstract]
-            return False, f"[X] '{abstract}'는 측정 필요한 추상적 개념 -> '{', '.join(suggestions[:3])}' 등 구체적 현상으로 대체"
-
-    # 눈에 보이는 현상 목록에 있는지 확인 (권장 사항)
-    has_visible = any(v in content for v in VISIBLE_PHENOMENA)
-
-    if not has_visible and len(content) > 2:
-        # 완전히 새로운 표현인 경우 경고 (강제 금지는 아님)
-        return True, f"[WARN] 눈에 보이는 현상인지 확인 필요: '{content}'"
+        if abstract in found:
+            return False, REASONS['abstract'][abstract]
 
+    # VISIBLE_PHENOMENA 목록 외 표현은 권장 사항일 뿐 위반이 아니므로 별도 검사 없음
     return True, "OK"
 
 
@@ -377,35 +598,87 @@ def validate_mechanism_keywords(value: str) -> Tuple[bool, str]:
     피로, 크리프 등은 G열(고장 메커니즘)로 이동 필요
     옵션 A 형식 지원: 괄호 안 설명은 검증 대상에서 제외
     """
-    if pd.isna(value) or str(value).strip() == '':
-        return True, "빈 값"
-
-    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증
+    # 옵션 A: 괄호 안 설명 제거 후 메인 내용만 검증 (빈 값/NaN은 '')
     value_str = extract_main_content(value)
 
     if not value_str:
         return True, "빈 값"
 
     # 태그 제거 후 내용만 검사
-    content = value_str
-    for tag in REQUIRED_TAGS:
-        if tag in value_str:
-            content = value_str.split(tag, 1)[1].strip()
-            break
+    _, content = _split_tag(value_str)
+    return _check_mechanism_keywords(content)
+
+
+def _check_mechanism_keywords(content: str) -> Tuple[bool, str]:
+    """메커니즘 용어 검사 (태그 제거된 내용 기준)"""
+    found = _keywords_in(content)
 
     # 메커니즘 용어 체크 (BLOCKING - 작성가이드 V1.2 근거)
     for mechanism in MECHANISM_KEYWORDS:
-        if mechanism in content:
-            return False, f"[BLOCKING] '{mechanism}'은 메커니즘(과정)! E열(현재 현상) -> G열(메커니즘)로 이동"
+        if mechanism in found:
+            return False, REASONS['mechanism'][mechanism]
 
     return True, "OK"
 
 
-def validate_tag_coverage(values: list) -> dict:
+def validate_row(value) -> dict:
+    """
+    단일 셀에 대한 전체 검증을 한 번에 수행
+
+    메인 내용 추출과 태그 분리를 1회만 수행한 뒤
+    금지어/태그/메커니즘/눈에 보이는 현상 검증을 순서대로 적용
+
+    Returns:
+        {
+            "forbidden": [reason, ...],   # validate_failure_mode
+            "tag": [reason, ...],         # validate_tag_format + validate_tag_content_relation
+            "mechanism": [reason, ...],   # validate_mechanism_keywords
+            "visibility": [reason, ...]   # validate_visibility
+        }
+    """
+    row_violations = {"forbidden": [], "tag": [], "mechanism": [], "visibility": []}
+
+    value_str = extract_main_content(value)
+    if not value_str:
+        return row_violations
+
+    tag, content = _split_tag(value_str)
+
+    is_valid, reason = _check_forbidden(value_str)
+    if not is_valid:
+        row_violations["forbidden"].append(reason)
+
+    is_valid, reason = _check_tag_format(tag)
+    if not is_valid:
+        row_violations["tag"].append(reason)
+
+    is_valid, reason = _check_tag_content_relation(tag, content)
+    if not is_valid:
+        row_violations["tag"].append(reason)
+
+    is_valid, reason = _check_mechanism_keywords(content)
+    if not is_valid:
+        row_violations["mechanism"].append(reason)
+
+    is_valid, reason = _check_visibility(content)
+    if not is_valid:
+        row_violations["visibility"].append(reason)
+
+    return row_violations
+
+
+def validate_tag_coverage(values) -> dict:
     """
     과/부족/유해 분포 검증
+
+    Args:
+        values: 고장형태 값 목록 (list 또는 pandas Series)
     """
-    counts = {tag: sum(1 for v in values if pd.notna(v) and tag in str(v)) for tag in REQUIRED_TAGS}
+    series = values if isinstance(values, pd.Series) else pd.Series(values, dtype=object)
+    series = series.dropna().astype(str)
+
+    # 태그별 포함 행 수 (벡터 연산, 정규식 미사용)
+    counts = {tag: int(series.str.contains(tag, regex=False).sum()) for tag in REQUIRED_TAGS}
     warnings = []
 
     if counts['부족:'] == 0:
@@ -418,116 +691,150 @@ def validate_tag_coverage(values: list) -> dict:
     return {"counts": counts, "warnings": warnings}
 
 
-def validate_excel_file(file_path: str) -> dict:
+# validate_row 카테고리 -> validate_excel_file 결과 키
+_ROW_VIOLATION_KEYS = {
+    "forbidden": "violations",
+    "tag": "tag_violations",
+    "mechanism": "mechanism_violations",
+    "visibility": "visibility_violations",
+}
+
+
+def _find_header_col(row: tuple, header: str) -> Optional[int]:
     """
-    Excel 파일의 고장형태 열 전체 검증
+    행에서 헤더 열 위치 찾기 (없으면 None)
 
-    Returns:
-        {
-            "status": "pass" | "fail",
-            "total_rows": int,
-            "violations": [{"row": int, "value": str, "reason": str}, ...]
-        }
+    정확히 일치하는 셀은 tuple.index로 바로 찾고,
+    공백이 섞인 경우에만 문자열 셀을 strip 비교 (숫자/빈 셀은 문자열 변환 생략)
     """
-    result = {
-        "status": "pass",
-        "total_rows": 0,
-        "checked_rows": 0,
-        "violations": [],
-        "tag_violations": [],
-        "mechanism_violations": [],
-        "visibility_violations": [],  # 눈에 보이는 현상 위반
-        "tag_coverage": {}
-    }
+    if header in row:
+        return row.index(header)
+    for j, val in enumerate(row):
+        if isinstance(val, str) and val.strip() == header:
+            return j
+    return None
+
+
+# 병렬 검증 임계 행 수 (미만이면 워커 기동 비용이 더 큼)
+# 측정: 직렬 검증 약 9~35us/행 (5000행 47ms), spawn 워커는 모듈 import에 약 0.65~0.9s
+# -> 4워커 기준 손익분기 약 3만~13만 행 (6000행 시트를 풀로 돌리면 0.53s -> 3.3s)
+# Windows는 spawn만 지원하므로 손익분기 상한으로 설정
+_PARALLEL_MIN_ROWS = 150000
+
+
+def _validate_rows(values: list) -> Iterator[dict]:
+    """
+    값 목록에 validate_row 적용 (입력 순서 유지, 결과를 순차 생성)
+
+    대용량 시트는 multiprocessing.Pool로 분산 검증
+    워커는 모듈 import 시 온톨로지(파싱 캐시)와 키워드 DB를 각자 구성
+    """
+    processes = cpu_count()
+    if len(values) < _PARALLEL_MIN_ROWS or processes < 2:
+        yield from map(validate_row, values)
+        return
+
+    with Pool(processes) as pool:
+        yield from pool.imap(validate_row, values, chunksize=max(1, len(values) // (processes * 4)))
+
+
+# 개별 위반 항목 (category: validate_row 카테고리)
+Violation = namedtuple('Violation', 'category row value reason')
+
+
+def iter_violations(file_path: str, stats: Optional[dict] = None) -> Iterator[Violation]:
+    """
+    Excel 파일의 고장형태 열을 검증하며 위반 항목을 발견 순서대로 생성
+
+    Args:
+        file_path: FMEA Excel 파일
+        stats: 전달 시 첫 위반 생성 전(또는 소진 시)에
+               total_rows / checked_rows / tag_coverage 를 채움
+
+    Raises:
+        FileNotFoundError: 파일 없음
+        ValueError: 고장형태 열을 찾을 수 없음
+    """
+    # FMEA 시트 스트리밍 읽기 (read_only: 행 단위 값만 순회, DataFrame 미생성)
+    wb = load_workbook(file_path, read_only=True, data_only=True)
 
     try:
-        # FMEA 시트 읽기 (헤더 없이)
-        df = pd.read_excel(file_path, sheet_name='FMEA', header=None)
-        result["total_rows"] = len(df)
+        ws = wb['FMEA']
+        rows = ws.iter_rows(values_only=True)
 
-        # 헤더 행 찾기 (고장형태 열 위치 확인)
+        # 헤더 행 찾기 (상위 10행 내 고장형태 열 위치 확인)
         failure_mode_col = None
         header_row = None
 
-        for i in range(min(10, len(df))):
-            row = df.iloc[i]
-            for j, val in enumerate(row):
-                if str(val).strip() == '고장형태':
-                    failure_mode_col = j
-                    header_row = i
-                    break
+        for i, row in enumerate(rows):
+            if i >= 10:
+                break
+            failure_mode_col = _find_header_col(row, '고장형태')
             if failure_mode_col is not None:
+                header_row = i
                 break
 
         if failure_mode_col is None:
-            return {
-                "status": "error",
-                "message": "고장형태 열을 찾을 수 없습니다.",
-                "violations": []
-            }
+            raise ValueError("고장형태 열을 찾을 수 없습니다.")
 
-        # 데이터 행 검증 (헤더 다음 행부터)
+        # 데이터 행 수집 (헤더 다음 행부터, 빈 값 제외)
+        row_numbers = []
         all_values = []
-        for i in range(header_row + 1, len(df)):
-            value = df.iloc[i, failure_mode_col]
+        i = header_row
+        for i, row in enumerate(rows, start=header_row + 1):
+            value = row[failure_mode_col] if failure_mode_col < len(row) else None
 
-            if pd.isna(value) or str(value).strip() == '':
+            if _is_empty(value):
                 continue
 
+            row_numbers.append(i + 1)
             all_values.append(value)
-            result["checked_rows"] += 1
-
-            # 기존 금지어 검증
-            is_valid, reason = validate_failure_mode(value)
-            if not is_valid:
-                result["violations"].append({
-                    "row": i + 1,
-                    "value": str(value),
-                    "reason": reason
-                })
-
-            # 태그 형식 검증
-            tag_valid, tag_reason = validate_tag_format(value)
-            if not tag_valid:
-                result["tag_violations"].append({
-                    "row": i + 1,
-                    "value": str(value),
-                    "reason": tag_reason
-                })
-
-            # 태그-내용 인과관계 검증
-            relation_valid, relation_reason = validate_tag_content_relation(value)
-            if not relation_valid:
-                result["tag_violations"].append({
-                    "row": i + 1,
-                    "value": str(value),
-                    "reason": relation_reason
-                })
-
-            # 메커니즘 용어 검증 (E열 -> G열 이동 필요 항목)
-            mech_valid, mech_reason = validate_mechanism_keywords(value)
-            if not mech_valid:
-                result["mechanism_violations"].append({
-                    "row": i + 1,
-                    "value": str(value),
-                    "reason": mech_reason
-                })
-
-            # 눈에 보이는 현상 검증 (의미론적 검증)
-            vis_valid, vis_reason = validate_visibility(value)
-            if not vis_valid:
-                result["visibility_violations"].append({
-                    "row": i + 1,
-                    "value": str(value),
-                    "reason": vis_reason
-                })
+    finally:
+        wb.close()
 
+    if stats is not None:
+        stats["total_rows"] = i + 1
+        stats["checked_rows"] = len(all_values)
         # 태그 분포 검증
-        result["tag_coverage"] = validate_tag_coverage(all_values)
+        stats["tag_coverage"] = validate_tag_coverage(all_values)
+
+    # 금지어/태그/메커니즘/눈에 보이는 현상 검증 (행별 단일 패스)
+    for row_no, value, row_violations in zip(row_numbers, all_values, _validate_rows(all_values)):
+        for category, reasons in row_violations.items():
+            for reason in reasons:
+                yield Violation(category, row_no, str(value), reason)
 
-        if result["violations"] or result["tag_violations"] or result["mechanism_violations"] or result["visibility_violations"]:
-            result["status"] = "fail"
 
+def validate_excel_file(file_path: str) -> dict:
+    """
+    Excel 파일의 고장형태 열 전체 검증 (iter_violations 결과를 dict로 수집)
+
+    Returns:
+        {
+            "status": "pass" | "fail",
+            "total_rows": int,
+            "violations": [{"row": int, "value": str, "reason": str}, ...]
+        }
+    """
+    result = {
+        "status": "pass",
+        "total_rows": 0,
+        "checked_rows": 0,
+        "violations": [],
+        "tag_violations": [],
+        "mechanism_violations": [],
+        "visibility_violations": [],  # 눈에 보이는 현상 위반
+        "tag_coverage": {}
+    }
+    stats = {}
+
+    try:
+        for v in iter_violations(file_path, stats):
+            result[_ROW_VIOLATION_KEYS[v.category]].append({
+                "row": v.row,
+                "value": v.value,
+                "reason": v.reason
+            })
     except FileNotFoundError:
         return {
             "status": "error",
@@ -541,9 +848,53 @@ def validate_excel_file(file_path: str) -> dict:
             "violations": []
         }
 
+    result.update(stats)
+
+    if result["violations"] or result["tag_violations"] or result["mechanism_violations"] or result["visibility_violations"]:
+        result["status"] = "fail"
+
     return result
 
 
+def stream_report(violations: Iterable[Violation], stats: dict) -> bool:
+    """
+    위반 항목을 생성되는 즉시 출력하는 스트리밍 보고서 (요약은 마지막에 출력)
+
+    Args:
+        violations: iter_violations() 결과
+        stats: iter_violations()에 전달한 stats dict
+
+    Returns:
+        위반 존재 여부
+    """
+    print("\n" + "=" * 60)
+    print("[VALIDATE] Failure Mode (E column) Validation (stream)")
+    print("=" * 60)
+
+    counts = dict.fromkeys(_ROW_VIOLATION_KEYS, 0)
+    for v in violations:
+        counts[v.category] += 1
+        print(f"    [{v.category}] Row {v.row}: \"{v.value}\"")
+        print(f"           -> {v.reason}")
+
+    print("-" * 60)
+    print(f"Total rows: {stats.get('total_rows', 0)}")
+    print(f"Checked rows: {stats.get('checked_rows', 0)}")
+    print("Violations: " + ", ".join(f"{category}={count}" for category, count in counts.items()))
+
+    coverage = stats.get("tag_coverage", {})
+    tag_counts = coverage.get("counts", {})
+    print("Tag Coverage: " + " / ".join(f"{tag} {tag_counts.get(tag, 0)}개" for tag in REQUIRED_TAGS))
+    for w in coverage.get("warnings", []):
+        print(f"    {w}")
+
+    has_violation = any(counts.values())
+    print("[FAIL] Please fix the issues above." if has_violation else "[PASS] All validations passed.")
+    print("=" * 60)
+
+    return has_violation
+
+
 def print_report(result: dict):
     """검증 결과 보고서 출력"""
     print("\n" + "=" * 60)
@@ -621,20 +972,42 @@ def print_report(result: dict):
 
 
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python validate_failure_mode.py <excel_file>")
-        print("예시: python validate_failure_mode.py 철심_FMEA.xlsx")
-        sys.exit(1)
-
-    file_path = sys.argv[1]
-    result = validate_excel_file(file_path)
+    parser = argparse.ArgumentParser(
+        description='고장형태(E열) 금지어 검증',
+        epilog='예시: python validate_failure_mode.py 철심_FMEA.xlsx'
+    )
+    parser.add_argument('excel_file', help='검증할 FMEA Excel 파일')
+    parser.add_argument(
+        '--json',
+        action=argparse.BooleanOptionalAction,
+        default=True,
+        help='JSON 결과 출력 여부 (파이프라인 연동용, 기본: 출력)'
+    )
+    parser.add_argument(
+        '--stream',
+        action='store_true',
+        help='위반 항목을 발견 즉시 출력 (대용량 시트용, JSON 출력 생략)'
+    )
+    args = parser.parse_args()
+
+    if args.stream:
+        stats = {}
+        try:
+            has_violation = stream_report(iter_violations(args.excel_file, stats), stats)
+        except Exception as e:
+            print(f"[ERROR] {e}")
+            sys.exit(1)
+        sys.exit(1 if has_violation else 0)
+
+    result = validate_excel_file(args.excel_file)
 
     # 보고서 출력
     print_report(result)
 
-    # JSON 결과 출력 (파이프라인 연동용)
-    print("\n[JSON Output]")
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    # JSON 결과 출력 (파이프라인 연동용) - 요청 시에만 직렬화
+    if args.json:
+        print("\n[JSON Output]")
+        print(dumps_json(result))
 
     # 종료 코드
     if result["status"] == "pass":
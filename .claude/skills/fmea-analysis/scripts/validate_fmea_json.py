@@ -18,122 +18,237 @@ import sys
 import json
 import os
 import re
+from collections import defaultdict, deque
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain, islice
 from pathlib import Path
 
 # Windows cp949 인코딩 문제 해결
 from encoding_utils import setup_encoding
 setup_encoding()
 
-# 기존 검증 모듈 재사용
-from validate_failure_mode import validate_failure_mode, validate_tag_format
-from validate_failure_effect import validate_failure_effect, validate_physical_in_effect
-from validate_single_item import (
-    validate_mechanism,
-    validate_prevention_multiline,
-    validate_detection_multiline
-)
-from validate_causal_chain import validate_mode_cause, validate_cause_mechanism
+# ijson (선택): 설치 시 fmea_data 항목을 스트리밍 파싱
+try:
+    import ijson
+except ImportError:
+    ijson = None
+
+# ============================================================================
+# 기존 검증 모듈 재사용 (지연 로드 - 실제 사용하는 컬럼의 모듈/온톨로지만 import)
+# ============================================================================
+
+@lru_cache(maxsize=None)
+def _mode_validators():
+    """E열: (validate_failure_mode, validate_tag_format)"""
+    from validate_failure_mode import validate_failure_mode, validate_tag_format
+    return validate_failure_mode, validate_tag_format
+
+
+@lru_cache(maxsize=None)
+def _effect_validators():
+    """C열: (validate_failure_effect, validate_physical_in_effect)"""
+    from validate_failure_effect import validate_failure_effect, validate_physical_in_effect
+    return validate_failure_effect, validate_physical_in_effect
+
+
+@lru_cache(maxsize=None)
+def _multiline_validators():
+    """G/H/J열: {컬럼: 에러 리스트 반환 검증 함수}"""
+    from validate_single_item import (
+        validate_mechanism,
+        validate_prevention_multiline,
+        validate_detection_multiline
+    )
+    return {
+        'G열': validate_mechanism,
+        'H열': validate_prevention_multiline,
+        'J열': validate_detection_multiline,
+    }
 
 
-def validate_column_e(items):
-    """E열 (고장형태) 검증: 태그 + 메커니즘 제외"""
+@lru_cache(maxsize=None)
+def _mode_cause_validator():
+    """E->F: validate_mode_cause"""
+    from validate_causal_chain import validate_mode_cause
+    return validate_mode_cause
+
+
+@lru_cache(maxsize=1)
+def _cached_forbidden_physical():
+    """effect-ontology.md의 C열 금지 물리적 상태 목록 (프로세스당 1회 로드)"""
+    from validate_failure_effect import load_effect_ontology
+    ontology = load_effect_ontology()
+    return tuple(ontology.get('forbidden_physical', []))
+
+
+def _load_validators():
+    """validate_all에 필요한 지연 로드 모듈/온톨로지를 모두 로드"""
+    _mode_validators()
+    _effect_validators()
+    _multiline_validators()
+    _mode_cause_validator()
+    _cached_forbidden_physical()
+
+
+# ============================================================================
+# 위반 표현 (항목 번호, 코드, 인자) - 출력 시점에만 문자열로 포맷
+# ============================================================================
+
+_VIOLATION_TEMPLATES = {
+    'E_TAG': 'E열 태그 누락 - "{0:.30}..."',
+    'E_MODE': 'E열 {0}',
+    'C_PHYSICAL': 'C열 물리적 상태 포함 - "{0:.40}..." -> {1}',
+    'C_EFFECT': 'C열 {0}',
+    'F_TAG': 'F열 라이프사이클 태그 누락 - "{0:.30}..."',
+    'G열': 'G열 {0}',
+    'H열': 'H열 {0}',
+    'J열': 'J열 {0}',
+    'CAUSAL': 'E->F 인과관계 오류 - {0}',
+}
+
+
+def format_violation(violation):
+    """(항목 번호, 코드, 인자) 위반을 출력 문자열로 변환"""
+    i, code, args = violation
+    return f"  - 항목 {i}: " + _VIOLATION_TEMPLATES[code].format(*args)
+
+
+def _format_all(violations):
+    return [format_violation(v) for v in violations]
+
+
+# ============================================================================
+# 항목 단위 검사 (컬럼별 함수와 validate_all에서 공용)
+# ============================================================================
+
+def _check_column_e(i, failure_mode):
+    """E열 (고장형태) 단일 항목 검사"""
     violations = []
-    for i, item in enumerate(items, 1):
-        failure_mode = item.get('고장형태', '')
 
-        # 태그 검증 - validate_tag_format()은 Tuple[bool, str] 반환
-        is_valid_tag, reason_tag = validate_tag_format(failure_mode)
-        if not is_valid_tag:
-            violations.append(f"  - 항목 {i}: E열 태그 누락 - \"{failure_mode[:30]}...\"")
+    validate_failure_mode, validate_tag_format = _mode_validators()
+
+    # 태그 검증 - validate_tag_format()은 Tuple[bool, str] 반환
+    is_valid_tag, reason_tag = validate_tag_format(failure_mode)
+    if not is_valid_tag:
+        violations.append((i, 'E_TAG', (failure_mode,)))
 
-        # 메커니즘 금지어 검증 - validate_failure_mode()도 Tuple[bool, str] 반환
-        is_valid_mode, reason_mode = validate_failure_mode(failure_mode)
-        if not is_valid_mode:
-            violations.append(f"  - 항목 {i}: E열 {reason_mode}")
+    # 메커니즘 금지어 검증 - validate_failure_mode()도 Tuple[bool, str] 반환
+    is_valid_mode, reason_mode = validate_failure_mode(failure_mode)
+    if not is_valid_mode:
+        violations.append((i, 'E_MODE', (reason_mode,)))
 
     return violations
 
 
-def validate_column_c(items, forbidden_physical=None):
-    """C열 (고장영향) 검증: 물리적 상태 제외"""
+def _check_column_c(i, effect, forbidden_physical):
+    """C열 (고장영향) 단일 항목 검사"""
     violations = []
 
-    # forbidden_physical이 없으면 온톨로지에서 로드
-    if forbidden_physical is None:
-        from validate_failure_effect import load_effect_ontology
-        ontology = load_effect_ontology()
-        forbidden_physical = ontology.get('forbidden_physical', [])
+    validate_failure_effect, validate_physical_in_effect = _effect_validators()
 
-    for i, item in enumerate(items, 1):
-        effect = item.get('고장영향', '')
+    # 물리적 상태 검증 - 올바른 함수 시그니처 사용
+    is_valid, reason = validate_physical_in_effect(effect, forbidden_physical)
+    if not is_valid:
+        violations.append((i, 'C_PHYSICAL', (effect, reason)))
+
+    # 검사/판정 결과 검증 - validate_failure_effect()는 Tuple[bool, str] 반환
+    is_valid_effect, reason_effect = validate_failure_effect(effect)
+    if not is_valid_effect:
+        violations.append((i, 'C_EFFECT', (reason_effect,)))
+
+    return violations
+
+
+LIFECYCLE_STAGES = ['설계', '재료', '제작', '시험']
+
+# 라이프사이클 태그 (F열 필수 검사는 위치 무관, 밸런스 집계는 접두 태그만)
+_LIFECYCLE_TAG_RE = re.compile('|'.join(f'{stage}:' for stage in LIFECYCLE_STAGES))
+_LIFECYCLE_STAGE_SET = frozenset(LIFECYCLE_STAGES)
 
-        # 물리적 상태 검증 - 올바른 함수 시그니처 사용
-        is_valid, reason = validate_physical_in_effect(effect, forbidden_physical)
+
+def _check_column_f(i, cause):
+    """F열 (고장원인) 단일 항목 검사"""
+    has_tag = _LIFECYCLE_TAG_RE.search(cause) is not None
+    if not has_tag:
+        return [(i, 'F_TAG', (cause,))]
+    return []
+
+
+def _check_multiline(i, column, value):
+    """G/H/J열 단일 항목 검사 - 컬럼별 검증 함수는 에러 리스트 반환"""
+    return [(i, column, (err,)) for err in _multiline_validators()[column](value)]
+
+
+# 동일 (형태, 원인) 쌍 반복이 많아 결과 메모이제이션 (validate_mode_cause는 입력을 strip 후 판정)
+@lru_cache(maxsize=4096)
+def _cached_mode_cause(mode, cause):
+    return _mode_cause_validator()(mode, cause)
+
+
+def _check_causal(i, mode, cause):
+    """E->F 인과관계 단일 항목 검사"""
+    if mode and cause:
+        # E->F 검증: 고장형태와 원인의 인과관계 확인
+        if isinstance(mode, str) and isinstance(cause, str):
+            is_valid, reason = _cached_mode_cause(mode.strip(), cause.strip())
+        else:
+            is_valid, reason = _mode_cause_validator()(mode, cause)
         if not is_valid:
-            violations.append(f"  - 항목 {i}: C열 물리적 상태 포함 - \"{effect[:40]}...\" -> {reason}")
+            return [(i, 'CAUSAL', (reason,))]
+    return []
 
-        # 검사/판정 결과 검증 - validate_failure_effect()는 Tuple[bool, str] 반환
-        is_valid_effect, reason_effect = validate_failure_effect(effect)
-        if not is_valid_effect:
-            violations.append(f"  - 항목 {i}: C열 {reason_effect}")
 
-    return violations
+def validate_column_e(items):
+    """E열 (고장형태) 검증: 태그 + 메커니즘 제외"""
+    violations = []
+    for i, item in enumerate(items, 1):
+        violations.extend(_check_column_e(i, item.get('고장형태', '')))
+    return _format_all(violations)
+
+
+def validate_column_c(items, forbidden_physical=None):
+    """C열 (고장영향) 검증: 물리적 상태 제외"""
+    # forbidden_physical이 없으면 온톨로지에서 로드 (캐시)
+    if forbidden_physical is None:
+        forbidden_physical = _cached_forbidden_physical()
+
+    violations = []
+    for i, item in enumerate(items, 1):
+        violations.extend(_check_column_c(i, item.get('고장영향', ''), forbidden_physical))
+    return _format_all(violations)
 
 
 def validate_column_f(items):
     """F열 (고장원인) 검증: 라이프사이클 태그 필수"""
     violations = []
-    lifecycle_tags = ['설계:', '재료:', '제작:', '시험:']
-
     for i, item in enumerate(items, 1):
-        cause = item.get('고장원인', '')
-        has_tag = any(tag in cause for tag in lifecycle_tags)
-        if not has_tag:
-            violations.append(f"  - 항목 {i}: F열 라이프사이클 태그 누락 - \"{cause[:30]}...\"")
-
-    return violations
+        violations.extend(_check_column_f(i, item.get('고장원인', '')))
+    return _format_all(violations)
 
 
 def validate_column_g(items):
     """G열 (고장메커니즘) 검증: 화살표 2개 이상"""
     violations = []
     for i, item in enumerate(items, 1):
-        mechanism = item.get('고장메커니즘', '')
-        # validate_mechanism()은 에러 리스트 반환
-        errors = validate_mechanism(mechanism)
-        if errors:
-            for err in errors:
-                violations.append(f"  - 항목 {i}: G열 {err}")
-
-    return violations
+        violations.extend(_check_multiline(i, 'G열', item.get('고장메커니즘', '')))
+    return _format_all(violations)
 
 
 def validate_column_h(items):
     """H열 (현재예방대책) 검증: 4줄 이상 + 기준값 + 태그 2개 이상"""
     violations = []
     for i, item in enumerate(items, 1):
-        prevention = item.get('현재예방대책', '')
-        # validate_prevention_multiline()은 에러 리스트 반환
-        errors = validate_prevention_multiline(prevention)
-        if errors:
-            for err in errors:
-                violations.append(f"  - 항목 {i}: H열 {err}")
-
-    return violations
+        violations.extend(_check_multiline(i, 'H열', item.get('현재예방대책', '')))
+    return _format_all(violations)
 
 
 def validate_column_j(items):
     """J열 (현재검출대책) 검증: 4줄 이상 + 합격기준 + 태그 2개 이상"""
     violations = []
     for i, item in enumerate(items, 1):
-        detection = item.get('현재검출대책', '')
-        # validate_detection_multiline()은 에러 리스트 반환
-        errors = validate_detection_multiline(detection)
-        if errors:
-            for err in errors:
-                violations.append(f"  - 항목 {i}: J열 {err}")
-
-    return violations
+        violations.extend(_check_multiline(i, 'J열', item.get('현재검출대책', '')))
+    return _format_all(violations)
 
 
 def validate_causal_relationships(items):
@@ -144,33 +259,22 @@ def validate_causal_relationships(items):
     """
     violations = []
     for i, item in enumerate(items, 1):
-        mode = item.get('고장형태', '')
-        cause = item.get('고장원인', '')
+        violations.extend(_check_causal(i, item.get('고장형태', ''), item.get('고장원인', '')))
+    return _format_all(violations)
 
-        if mode and cause:
-            # E->F 검증: 고장형태와 원인의 인과관계 확인
-            is_valid, reason = validate_mode_cause(mode, cause)
-            if not is_valid:
-                violations.append(f"  - 항목 {i}: E->F 인과관계 오류 - {reason}")
 
-    return violations
+# ============================================================================
+# 집계 검사 (라이프사이클 / 다이아몬드)
+# ============================================================================
 
+def _lifecycle_stage(cause):
+    """고장원인의 라이프사이클 단계 (접두 태그 없으면 None)"""
+    head, sep, _ = cause.partition(':')
+    return head if sep and head in _LIFECYCLE_STAGE_SET else None
 
-def validate_lifecycle_balance(items):
-    """F열 라이프사이클 비율 검증 [WARNING]
-
-    각 단계 비율: 10% 이상 권장, 0%는 BLOCKING
-    목표: 설계(15-25%), 재료(20-30%), 제작(25-35%), 시험(15-25%)
-    """
-    stage_count = {'설계': 0, '재료': 0, '제작': 0, '시험': 0}
-
-    for item in items:
-        cause = item.get('고장원인', '')
-        for stage in stage_count.keys():
-            if cause.startswith(f'{stage}:'):
-                stage_count[stage] += 1
-                break
 
+def _summarize_lifecycle(stage_count):
+    """단계별 개수 -> 라이프사이클 밸런스 판정"""
     total = sum(stage_count.values())
     if total == 0:
         return {'valid': False, 'violations': ['원인 데이터 없음'], 'stage_count': stage_count}
@@ -196,38 +300,51 @@ def validate_lifecycle_balance(items):
     }
 
 
-def validate_diamond_preview(items):
-    """다이아몬드 구조 사전 경고 (GATE 4 BLOCKING 조기 발견)
-
-    목적: Excel 생성 전에 다이아몬드 구조 문제를 조기 발견하여
-          불필요한 토큰 낭비 방지 (~60,000 tokens 절약 가능)
+def validate_lifecycle_balance(items):
+    """F열 라이프사이클 비율 검증 [WARNING]
 
-    규칙: 고장형태당 고장원인 >= 2개 필수
+    각 단계 비율: 10% 이상 권장, 0%는 BLOCKING
+    목표: 설계(15-25%), 재료(20-30%), 제작(25-35%), 시험(15-25%)
     """
-    from collections import defaultdict
-
-    mode_to_causes = defaultdict(set)
+    stage_count = {stage: 0 for stage in LIFECYCLE_STAGES}
 
     for item in items:
-        # 고장형태에서 태그 제거하고 실제 형태만 추출
-        mode_raw = item.get('고장형태', '')
-        # 태그(부족:, 과도:, 유해:) 제거
-        mode = mode_raw
-        for tag in ['부족:', '과도:', '유해:']:
-            mode = mode.replace(tag, '')
-        mode = mode.strip()
+        stage = _lifecycle_stage(item.get('고장원인', ''))
+        if stage:
+            stage_count[stage] += 1
+
+    return _summarize_lifecycle(stage_count)
+
+
+_MODE_TAG_STRIP_RE = re.compile(r'(부족|과도|유해):')
+
 
-        cause = item.get('고장원인', '').strip()
+def _add_mode_cause(mode_to_causes, mode_raw, cause_raw):
+    """다이아몬드 집계에 (형태, 원인) 1쌍 추가"""
+    # 태그(부족:, 과도:, 유해:) 제거하고 실제 형태만 추출
+    mode = _MODE_TAG_STRIP_RE.sub('', mode_raw).strip()
 
-        if mode and cause:
-            mode_to_causes[mode].add(cause)
+    cause = cause_raw.strip()
+
+    if mode and cause:
+        mode_to_causes[mode].add(cause)
+
+
+def _summarize_diamond(mode_to_causes):
+    """형태별 원인 집합 -> 다이아몬드 구조 판정"""
+    # 원인 총수 + 원인이 2개 미만인 고장형태를 1회 순회로 집계
+    total_causes = 0
+    single_cause_modes = []
+    for m, c in mode_to_causes.items():
+        count = len(c)
+        total_causes += count
+        if count < 2:
+            single_cause_modes.append((m, count))
 
-    # 원인이 2개 미만인 고장형태 찾기
-    single_cause_modes = [(m, len(c)) for m, c in mode_to_causes.items() if len(c) < 2]
     total_modes = len(mode_to_causes)
+    avg_causes = total_causes / max(total_modes, 1)
 
     if single_cause_modes:
-        avg_causes = sum(len(c) for c in mode_to_causes.values()) / max(total_modes, 1)
         return {
             'valid': False,
             'avg_causes': avg_causes,
@@ -236,7 +353,6 @@ def validate_diamond_preview(items):
             'message': f"형태당 원인 평균 {avg_causes:.2f}개 (>=2.0 필수)"
         }
 
-    avg_causes = sum(len(c) for c in mode_to_causes.values()) / max(total_modes, 1)
     return {
         'valid': True,
         'avg_causes': avg_causes,
@@ -245,6 +361,239 @@ def validate_diamond_preview(items):
     }
 
 
+def validate_diamond_preview(items):
+    """다이아몬드 구조 사전 경고 (GATE 4 BLOCKING 조기 발견)
+
+    목적: Excel 생성 전에 다이아몬드 구조 문제를 조기 발견하여
+          불필요한 토큰 낭비 방지 (~60,000 tokens 절약 가능)
+
+    규칙: 고장형태당 고장원인 >= 2개 필수
+    """
+    mode_to_causes = defaultdict(set)
+
+    for item in items:
+        _add_mode_cause(mode_to_causes, item.get('고장형태', ''), item.get('고장원인', ''))
+
+    return _summarize_diamond(mode_to_causes)
+
+
+# 항목 필드 키
+_K_MODE = '고장형태'
+_K_EFFECT = '고장영향'
+_K_CAUSE = '고장원인'
+_K_MECHANISM = '고장메커니즘'
+_K_PREVENTION = '현재예방대책'
+_K_DETECTION = '현재검출대책'
+
+# 컬럼별 검증 결과 키 (출력 순서)
+COLUMN_CHECKS = [
+    ('E열', _K_MODE),
+    ('C열', _K_EFFECT),
+    ('F열', _K_CAUSE),
+    ('G열', _K_MECHANISM),
+    ('H열', _K_PREVENTION),
+    ('J열', _K_DETECTION),
+]
+
+
+def _validate_chunk(chunk):
+    """
+    연속 항목 묶음 1회 순회 검증 (validate_all의 작업 단위, 워커 프로세스에서도 실행)
+
+    Args:
+        chunk: (시작 항목 번호, 항목 리스트)
+
+    Returns:
+        (항목 수, 컬럼별 위반 dict, 단계별 개수 dict, 형태별 원인 집합 dict)
+    """
+    start, items = chunk
+    forbidden_physical = _cached_forbidden_physical()
+    violations = {column: [] for column, _ in COLUMN_CHECKS}
+    violations['인과관계'] = []
+    stage_count = {stage: 0 for stage in LIFECYCLE_STAGES}
+    mode_to_causes = defaultdict(set)
+
+    # 위반 리스트 로컬 바인딩 (항목마다 dict 조회 생략)
+    e_violations = violations['E열']
+    c_violations = violations['C열']
+    f_violations = violations['F열']
+    g_violations = violations['G열']
+    h_violations = violations['H열']
+    j_violations = violations['J열']
+    causal_violations = violations['인과관계']
+
+    for i, item in enumerate(items, start):
+        # 필드 1회 추출
+        get = item.get
+        mode = get(_K_MODE, '')
+        cause = get(_K_CAUSE, '')
+
+        e_violations.extend(_check_column_e(i, mode))
+        c_violations.extend(_check_column_c(i, get(_K_EFFECT, ''), forbidden_physical))
+        f_violations.extend(_check_column_f(i, cause))
+        g_violations.extend(_check_multiline(i, 'G열', get(_K_MECHANISM, '')))
+        h_violations.extend(_check_multiline(i, 'H열', get(_K_PREVENTION, '')))
+        j_violations.extend(_check_multiline(i, 'J열', get(_K_DETECTION, '')))
+        causal_violations.extend(_check_causal(i, mode, cause))
+
+        stage = _lifecycle_stage(cause)
+        if stage:
+            stage_count[stage] += 1
+        _add_mode_cause(mode_to_causes, mode, cause)
+
+    return len(items), violations, stage_count, dict(mode_to_causes)
+
+
+# 병렬 검증 작업 단위 항목 수
+_PARALLEL_CHUNK_ITEMS = 1000
+
+# 병렬 검증 최소 항목 수 (이보다 적으면 단일 프로세스로 검증)
+# 측정: 워밍 후 순차 검증 약 26~70us/항목, 4워커 풀 기동+묶음 전달 고정 비용 약 0.06~0.14s
+# -> 2700항목(순차 0.07s)은 풀이 더 느리고, 약 7000항목 이상에서 손익분기
+_PARALLEL_MIN_ITEMS = 10000
+
+
+def _iter_chunks(items):
+    """항목 이터러블을 (시작 항목 번호, 리스트) 묶음으로 분할"""
+    chunk = []
+    start = 1
+    for item in items:
+        chunk.append(item)
+        if len(chunk) == _PARALLEL_CHUNK_ITEMS:
+            yield start, chunk
+            start += len(chunk)
+            chunk = []
+    if chunk:
+        yield start, chunk
+
+
+def _map_bounded(executor, chunks):
+    """
+    묶음을 _validate_chunk로 병렬 처리하고 결과를 입력 순서대로 반환
+
+    Executor.map은 모든 묶음을 즉시 제출해 스트리밍 입력을 부모 메모리에 전부 올리므로
+    진행 중인 작업을 CPU 수의 2배로 제한하고 앞선 결과를 꺼낸 뒤에 다음 묶음을 제출
+    """
+    window = 2 * (os.cpu_count() or 1)
+    pending = deque()
+    for chunk in chunks:
+        if len(pending) >= window:
+            yield pending.popleft().result()
+        pending.append(executor.submit(_validate_chunk, chunk))
+    while pending:
+        yield pending.popleft().result()
+
+
+def validate_all(items):
+    """
+    전체 검증을 items 1회 순회로 수행
+
+    항목마다 필드를 한 번만 꺼내 컬럼 검사/인과관계 검사를 모두 적용하고
+    라이프사이클/다이아몬드 집계도 같은 순회에서 누적
+    항목이 _PARALLEL_MIN_ITEMS 이상이면 _PARALLEL_CHUNK_ITEMS 묶음 단위로
+    ProcessPoolExecutor에 분산 후 입력 순서대로 병합 (진행 중인 묶음 수는 제한)
+
+    Returns:
+        {
+            "total": int,
+            "violations": {"E열": [...], ..., "J열": [...], "인과관계": [...]},
+                          (항목 번호, 코드, 인자) 튜플 - format_violation()으로 출력 문자열 변환
+            "lifecycle": validate_lifecycle_balance()와 같은 형식,
+            "diamond": validate_diamond_preview()와 같은 형식
+        }
+    """
+    violations = {column: [] for column, _ in COLUMN_CHECKS}
+    violations['인과관계'] = []
+    stage_count = {stage: 0 for stage in LIFECYCLE_STAGES}
+    mode_to_causes = defaultdict(set)
+    total = 0
+
+    def merge(partials):
+        nonlocal total
+        for count, chunk_violations, chunk_stages, chunk_modes in partials:
+            total += count
+            for column, found in chunk_violations.items():
+                violations[column].extend(found)
+            for stage, stage_total in chunk_stages.items():
+                stage_count[stage] += stage_total
+            for mode, causes in chunk_modes.items():
+                mode_to_causes[mode] |= causes
+
+    chunks = _iter_chunks(items)
+    # 최소 항목 수만큼만 먼저 읽어 병렬 여부 결정 (나머지는 스트리밍 유지)
+    min_chunks = _PARALLEL_MIN_ITEMS // _PARALLEL_CHUNK_ITEMS
+    leading = list(islice(chunks, min_chunks))
+
+    if len(leading) < min_chunks or (os.cpu_count() or 1) < 2:
+        merge(map(_validate_chunk, chain(leading, chunks)))
+    else:
+        # 지연 로드 모듈/온톨로지를 fork 전에 부모에서 1회 로드 (워커마다 재import 방지)
+        _load_validators()
+        with ProcessPoolExecutor() as executor:
+            merge(_map_bounded(executor, chain(leading, chunks)))
+
+    return {
+        'total': total,
+        'violations': violations,
+        'lifecycle': _summarize_lifecycle(stage_count),
+        'diamond': _summarize_diamond(mode_to_causes)
+    }
+
+
+class JSONLoadError(Exception):
+    """JSON 파일 열기/파싱 실패 (검증 함수에서 난 예외와 구분)"""
+
+
+_ROOT_NOT_OBJECT = '최상위 JSON이 객체가 아닙니다 ({"fmea_data": [...]} 형식 필요)'
+
+
+def iter_items(json_path):
+    """
+    JSON 파일의 fmea_data 항목을 하나씩 반환
+
+    ijson 설치 시 전체 객체 그래프를 메모리에 올리지 않고 스트리밍 파싱,
+    미설치 시 json.load 후 순회
+    파일 열기/파싱 오류와 최상위가 객체가 아닌 문서는 JSONLoadError로 변환
+    (항목 검증 중 예외는 그대로 전파)
+    """
+    if ijson is None:
+        try:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
+        except (OSError, ValueError) as e:
+            raise JSONLoadError(e) from e
+        if not isinstance(data, dict):
+            raise JSONLoadError(_ROOT_NOT_OBJECT)
+        yield from data.get('fmea_data', [])
+        return
+
+    try:
+        f = open(json_path, 'rb')
+    except OSError as e:
+        raise JSONLoadError(e) from e
+
+    with f:
+        # 첫 이벤트로 최상위 형태 확인 후 같은 이벤트 스트림에서 항목 추출
+        events = ijson.parse(f)
+        try:
+            first = next(events)
+        except (ijson.JSONError, OSError, ValueError) as e:
+            raise JSONLoadError(e) from e
+        if first[1] != 'start_map':
+            raise JSONLoadError(_ROOT_NOT_OBJECT)
+
+        items = ijson.items(chain([first], events), 'fmea_data.item')
+        while True:
+            # 스트리밍 파싱 오류는 다음 항목을 꺼낼 때만 발생 - yield 이후(검증 중) 예외는 감싸지 않음
+            try:
+                item = next(items)
+            except StopIteration:
+                return
+            except (ijson.JSONError, OSError, ValueError) as e:
+                raise JSONLoadError(e) from e
+            yield item
+
+
 def main():
     if len(sys.argv) < 2:
         print("사용법: python validate_fmea_json.py input_data.json")
@@ -252,16 +601,14 @@ def main():
 
     json_path = sys.argv[1]
 
-    # JSON 파일 로드
+    # JSON 파일 로드 + 전체 검증 (items 1회 순회)
     try:
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-    except Exception as e:
+        results = validate_all(iter_items(json_path))
+    except JSONLoadError as e:
         print(f"[ERROR] JSON 파일 로드 실패: {e}")
         sys.exit(1)
 
-    items = data.get('fmea_data', [])
-    total = len(items)
+    total = results['total']
 
     print("=" * 60)
     print("[GATE 3 사전 검증] 컬럼 형식 검증 (스크립트 기반)")
@@ -271,62 +618,23 @@ def main():
     all_violations = {}
 
     # 각 컬럼 검증
-    print("### E열 (고장형태) 검증...")
-    e_violations = validate_column_e(items)
-    if e_violations:
-        all_violations['E열'] = e_violations
-        print(f"   [X] {len(e_violations)}건 위반")
-    else:
-        print(f"   [O] 통과 ({total}개)")
-
-    print("### C열 (고장영향) 검증...")
-    c_violations = validate_column_c(items)
-    if c_violations:
-        all_violations['C열'] = c_violations
-        print(f"   [X] {len(c_violations)}건 위반")
-    else:
-        print(f"   [O] 통과 ({total}개)")
-
-    print("### F열 (고장원인) 검증...")
-    f_violations = validate_column_f(items)
-    if f_violations:
-        all_violations['F열'] = f_violations
-        print(f"   [X] {len(f_violations)}건 위반")
-    else:
-        print(f"   [O] 통과 ({total}개)")
-
-    print("### G열 (고장메커니즘) 검증...")
-    g_violations = validate_column_g(items)
-    if g_violations:
-        all_violations['G열'] = g_violations
-        print(f"   [X] {len(g_violations)}건 위반")
-    else:
-        print(f"   [O] 통과 ({total}개)")
-
-    print("### H열 (현재예방대책) 검증...")
-    h_violations = validate_column_h(items)
-    if h_violations:
-        all_violations['H열'] = h_violations
-        print(f"   [X] {len(h_violations)}건 위반")
-    else:
-        print(f"   [O] 통과 ({total}개)")
-
-    print("### J열 (현재검출대책) 검증...")
-    j_violations = validate_column_j(items)
-    if j_violations:
-        all_violations['J열'] = j_violations
-        print(f"   [X] {len(j_violations)}건 위반")
-    else:
-        print(f"   [O] 통과 ({total}개)")
+    for column, label in COLUMN_CHECKS:
+        print(f"### {column} ({label}) 검증...")
+        column_violations = results['violations'][column]
+        if column_violations:
+            all_violations[column] = column_violations
+            print(f"   [X] {len(column_violations)}건 위반")
+        else:
+            print(f"   [O] 통과 ({total}개)")
 
     # 인과관계 체인 검증 (CRITICAL - batch2 층간단락-턴수오류 문제 방지)
     print("\n### E->F 인과관계 체인 검증...")
-    causal_violations = validate_causal_relationships(items)
+    causal_violations = results['violations']['인과관계']
     if causal_violations:
         all_violations['인과관계'] = causal_violations
         print(f"   [X] {len(causal_violations)}건 인과관계 불일치")
         for v in causal_violations[:3]:
-            print(f"      {v}")
+            print(f"      {format_violation(v)}")
         if len(causal_violations) > 3:
             print(f"      ... 외 {len(causal_violations) - 3}건")
     else:
@@ -334,7 +642,7 @@ def main():
 
     # 라이프사이클 밸런스 검증
     print("\n### F열 라이프사이클 밸런스 검증...")
-    lifecycle_result = validate_lifecycle_balance(items)
+    lifecycle_result = results['lifecycle']
     if not lifecycle_result['valid']:
         all_violations['라이프사이클'] = lifecycle_result['violations']
         print(f"   [X] 라이프사이클 불균형")
@@ -350,7 +658,7 @@ def main():
 
     # 다이아몬드 구조 사전 검증 (GATE 4 BLOCKING 조기 발견)
     print("\n### 다이아몬드 구조 사전 검증...")
-    diamond_result = validate_diamond_preview(items)
+    diamond_result = results['diamond']
     diamond_warning = False
     if not diamond_result['valid']:
         diamond_warning = True
@@ -375,12 +683,15 @@ def main():
         total_violations = sum(len(v) for v in all_violations.values())
         print(f"\n총 {total_violations}건 위반:\n")
 
+        # 컬럼별 위반 목록은 한 번에 출력 (위반마다 print 호출 생략)
+        lines = []
         for column, violations in all_violations.items():
-            print(f"\n### {column} 위반 목록:")
-            for v in violations[:10]:  # 최대 10건만 출력
-                print(v)
+            lines.append(f"\n### {column} 위반 목록:")
+            # 최대 10건만 출력 (라이프사이클 위반은 이미 문자열)
+            lines.extend(v if isinstance(v, str) else format_violation(v) for v in violations[:10])
             if len(violations) > 10:
-                print(f"  ... 외 {len(violations) - 10}건")
+                lines.append(f"  ... 외 {len(violations) - 10}건")
+        sys.stdout.write('\n'.join(lines) + '\n')
 
         print("\n" + "-" * 60)
         print("[!] JSON 파일을 수정한 후 다시 검증하세요.")
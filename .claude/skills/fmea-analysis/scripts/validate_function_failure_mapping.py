@@ -22,13 +22,11 @@ FMEA Excel 생성 시 GATE 4에서 사용
 
 import sys
 import io
-import json
-import pandas as pd
+import re
+from openpyxl import load_workbook
 from pathlib import Path
 
-# Windows cp949 인코딩 문제 해결
-if sys.stdout:
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+from validation_utils import build_automaton, dumps_json
 
 # ============================================================================
 # 원인/형태 혼동 패턴 (E열에서 금지)
@@ -96,6 +94,67 @@ MEASUREMENT_PATTERNS = [
 ]
 
 
+# 위반 유형별 패턴 테이블 (검사/보고 순서)
+_PATTERN_TABLES = [
+    ('MECHANISM_IN_MODE', MECHANISM_IN_MODE_PATTERNS, '메커니즘이 형태에 포함됨'),
+    ('CAUSE_IN_MODE', CAUSE_IN_MODE_PATTERNS, '원인이 형태 위치에 있음'),
+    ('EFFECT_IN_MODE', EFFECT_IN_MODE_PATTERNS, '미래 영향이 형태 위치에 있음'),
+    ('MEASUREMENT_IN_MODE', MEASUREMENT_PATTERNS, '측정값이 형태 위치에 있음'),
+]
+
+
+def _cell_text(value) -> str:
+    """셀 값을 앞뒤 공백 제거 문자열로 변환 (None/NaN은 빈 문자열)"""
+    if isinstance(value, str):
+        return value.strip()
+    if value is None or (isinstance(value, float) and value != value):
+        return ''
+    return str(value).strip()
+
+
+def _compact(text: str) -> str:
+    """공백 제거 정규화 - 패턴 테이블 중복 판정 키 ('피로 파손' / '피로파손' 동일 취급)"""
+    return text.replace(' ', '')
+
+
+def _build_pattern_list(tables: list) -> list:
+    """
+    (type, ((pattern, reason), ...), suggestion) 평면 목록 - 인덱스 순서 = 보고 순서
+
+    띄어쓰기만 다른 패턴은 첫 항목의 표기 변형으로 묶어 셀당 1건만 보고
+    매칭은 패턴 표기 그대로 원문에 수행 (셀 공백을 지우면 '일정 전압'이 '정전'에 걸리는 등
+    단어 경계를 넘는 오탐 발생 - 테이블에 띄어쓴/붙여쓴 표기가 모두 있으므로 정규화 불필요)
+    """
+    entries = []
+    index_by_key = {}
+    for violation_type, table, label in tables:
+        for pattern, suggestion in table:
+            variant = (pattern, f'{label}: "{pattern}"')
+            key = _compact(pattern)
+            if key not in index_by_key:
+                index_by_key[key] = len(entries)
+                entries.append((violation_type, [variant], suggestion))
+            elif variant not in entries[index_by_key[key]][1]:
+                entries[index_by_key[key]][1].append(variant)
+    return [(violation_type, tuple(variants), suggestion) for violation_type, variants, suggestion in entries]
+
+
+_ALL_PATTERNS = _build_pattern_list(_PATTERN_TABLES)
+
+
+# 전체 패턴 표기 단일 Aho-Corasick 오토마톤 (값 = (_ALL_PATTERNS 인덱스, 표기))
+_AUTOMATON = build_automaton(
+    (pattern, (idx, pattern))
+    for idx, (_, variants, _) in enumerate(_ALL_PATTERNS)
+    for pattern, _ in variants
+)
+
+# 전체 패턴 합집합 정규식 (1회 버퍼 스캔으로 위반 후보 여부 판정)
+_ANY_PATTERN_RE = re.compile('|'.join(
+    re.escape(pattern) for _, variants, _ in _ALL_PATTERNS for pattern, _ in variants
+))
+
+
 def validate_failure_mode_mapping(value: str) -> list:
     """
     단일 고장형태 값의 원인/형태 혼동 검증
@@ -105,54 +164,46 @@ def validate_failure_mode_mapping(value: str) -> list:
     """
     violations = []
 
-    if pd.isna(value) or str(value).strip() == '':
+    value_str = _cell_text(value)
+    if not value_str:
         return violations
 
-    value_str = str(value).strip()
-
-    # 1. 메커니즘이 형태에 포함된 경우
-    for pattern, suggestion in MECHANISM_IN_MODE_PATTERNS:
-        if pattern in value_str:
-            violations.append({
-                'type': 'MECHANISM_IN_MODE',
-                'pattern': pattern,
-                'suggestion': suggestion,
-                'reason': f'메커니즘이 형태에 포함됨: "{pattern}"'
-            })
-
-    # 2. 원인이 형태에 포함된 경우
-    for pattern, suggestion in CAUSE_IN_MODE_PATTERNS:
-        if pattern in value_str:
-            violations.append({
-                'type': 'CAUSE_IN_MODE',
-                'pattern': pattern,
-                'suggestion': suggestion,
-                'reason': f'원인이 형태 위치에 있음: "{pattern}"'
-            })
-
-    # 3. 미래 영향이 형태에 포함된 경우
-    for pattern, suggestion in EFFECT_IN_MODE_PATTERNS:
-        if pattern in value_str:
-            violations.append({
-                'type': 'EFFECT_IN_MODE',
-                'pattern': pattern,
-                'suggestion': suggestion,
-                'reason': f'미래 영향이 형태 위치에 있음: "{pattern}"'
-            })
-
-    # 4. 측정값이 형태에 포함된 경우
-    for pattern, suggestion in MEASUREMENT_PATTERNS:
-        if pattern in value_str:
-            violations.append({
-                'type': 'MEASUREMENT_IN_MODE',
-                'pattern': pattern,
-                'suggestion': suggestion,
-                'reason': f'측정값이 형태 위치에 있음: "{pattern}"'
-            })
+    # 매칭된 패턴 인덱스 (테이블 순서로 정렬, 같은 패턴 반복 출현은 1회)
+    # found: 셀에 나타난 표기 판정 대상 (오토마톤은 매칭 표기 집합, 그 외는 셀 문자열 자체)
+    if _AUTOMATON is not None:
+        matches = set(value for _, value in _AUTOMATON.iter(value_str))
+        hits = sorted({idx for idx, _ in matches})
+        found = {pattern for _, pattern in matches}
+    elif _ANY_PATTERN_RE.search(value_str) is None:
+        # 대부분의 정상 값은 합집합 정규식 1회 스캔으로 종료
+        hits = []
+        found = value_str
+    else:
+        hits = [
+            idx for idx, (_, variants, _) in enumerate(_ALL_PATTERNS)
+            if any(pattern in value_str for pattern, _ in variants)
+        ]
+        found = value_str
+
+    # 1. 메커니즘 / 2. 원인 / 3. 미래 영향 / 4. 측정값이 형태에 포함된 경우
+    for idx in hits:
+        violation_type, variants, suggestion = _ALL_PATTERNS[idx]
+        # 셀에 실제로 나타난 표기로 보고 (둘 다 있으면 테이블 앞쪽 표기)
+        pattern, reason = next(variant for variant in variants if variant[0] in found)
+        violations.append({
+            'type': violation_type,
+            'pattern': pattern,
+            'suggestion': suggestion,
+            'reason': reason
+        })
 
     return violations
 
 
+# 보고서에 출력할 유형별 최대 위반 수
+TOP_VIOLATIONS_PER_TYPE = 10
+
+
 def validate_excel_file(file_path: str) -> dict:
     """
     Excel 파일의 기능-고장형태 논리 연결 검증
@@ -162,7 +213,9 @@ def validate_excel_file(file_path: str) -> dict:
             "status": "pass" | "fail",
             "total_rows": int,
             "checked_rows": int,
-            "violations": [{"row": int, "value": str, "issues": [...]}]
+            "violations": [{"row": int, "value": str, "issues": [...]}],
+            "summary": {유형: 위반 수},
+            "top_violations": {유형: [{"row", "value", "reason", "suggestion"}] (유형별 최대 10건)}
         }
     """
     result = {
@@ -175,53 +228,79 @@ def validate_excel_file(file_path: str) -> dict:
             "CAUSE_IN_MODE": 0,
             "EFFECT_IN_MODE": 0,
             "MEASUREMENT_IN_MODE": 0
+        },
+        "top_violations": {
+            "MECHANISM_IN_MODE": [],
+            "CAUSE_IN_MODE": [],
+            "EFFECT_IN_MODE": [],
+            "MEASUREMENT_IN_MODE": []
         }
     }
 
     try:
-        df = pd.read_excel(file_path, sheet_name='FMEA', header=None)
-        result["total_rows"] = len(df)
-
-        # 헤더 행 찾기 (고장형태 열 위치 확인)
-        failure_mode_col = None
-        header_row = None
-
-        for i in range(min(10, len(df))):
-            row = df.iloc[i]
-            for j, val in enumerate(row):
-                if str(val).strip() == '고장형태':
-                    failure_mode_col = j
-                    header_row = i
-                    break
-            if failure_mode_col is not None:
-                break
+        # FMEA 시트 스트리밍 읽기 (read_only: 고장형태 열 값만 사용, DataFrame 미생성)
+        wb = load_workbook(file_path, read_only=True, data_only=True)
+        try:
+            rows = wb['FMEA'].iter_rows(values_only=True)
 
-        if failure_mode_col is None:
-            return {
-                "status": "error",
-                "message": "고장형태 열을 찾을 수 없습니다.",
-                "violations": []
-            }
+            # 헤더 행 찾기 (상위 10행 내 고장형태 열 위치 확인)
+            failure_mode_col = None
+            header_row = None
 
-        # 데이터 행 검증
-        for i in range(header_row + 1, len(df)):
-            value = df.iloc[i, failure_mode_col]
+            for i, row in enumerate(rows):
+                if i >= 10:
+                    break
+                for j, val in enumerate(row):
+                    if isinstance(val, str) and val.strip() == '고장형태':
+                        failure_mode_col = j
+                        header_row = i
+                        break
+                if failure_mode_col is not None:
+                    break
 
-            if pd.isna(value) or str(value).strip() == '':
-                continue
+            if failure_mode_col is None:
+                return {
+                    "status": "error",
+                    "message": "고장형태 열을 찾을 수 없습니다.",
+                    "violations": []
+                }
+
+            # 데이터 행 수집 (헤더 다음 행부터, 빈 셀 제외)
+            values = []
+            i = header_row
+            for i, row in enumerate(rows, start=header_row + 1):
+                value = row[failure_mode_col] if failure_mode_col < len(row) else None
+                if not _cell_text(value):
+                    continue
+                values.append((i + 1, value))
+        finally:
+            wb.close()
+
+        result["total_rows"] = i + 1
+        result["checked_rows"] = len(values)
 
-            result["checked_rows"] += 1
+        # 데이터 행 검증
+        for row_no, value in values:
             issues = validate_failure_mode_mapping(value)
 
             if issues:
                 result["violations"].append({
-                    "row": i + 1,
+                    "row": row_no,
                     "value": str(value),
                     "issues": issues
                 })
 
+                # 유형별 건수 + 보고서용 상위 위반 (검증 중 함께 집계)
                 for issue in issues:
                     result["summary"][issue["type"]] += 1
+                    top = result["top_violations"][issue["type"]]
+                    if len(top) < TOP_VIOLATIONS_PER_TYPE:
+                        top.append({
+                            "row": row_no,
+                            "value": str(value),
+                            "reason": issue["reason"],
+                            "suggestion": issue["suggestion"]
+                        })
 
         if result["violations"]:
             result["status"] = "fail"
@@ -272,12 +351,22 @@ def print_report(result: dict):
     else:
         print("[FAIL] Please fix the following items:\n")
 
-        for v in result["violations"]:
-            print(f"  Row {v['row']}: \"{v['value']}\"")
-            for issue in v["issues"]:
-                print(f"    - {issue['reason']}")
-                print(f"      -> 수정: {issue['suggestion']}")
-            print()
+        # 유형별 상위 위반만 한 번에 출력 (전체 목록은 JSON 출력 참조)
+        lines = []
+        for violation_type, top in result["top_violations"].items():
+            if not top:
+                continue
+            count = result["summary"][violation_type]
+            lines.append(f"  [{violation_type}] {count}건")
+            for v in top:
+                lines.append(f"  Row {v['row']}: \"{v['value']}\"")
+                lines.append(f"    - {v['reason']}")
+                lines.append(f"      -> 수정: {v['suggestion']}")
+            if count > len(top):
+                lines.append(f"  ... 외 {count - len(top)}건")
+            lines.append('')
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
 
         print("-" * 70)
         print("[시점 기반 컬럼 구분 가이드]")
@@ -299,6 +388,10 @@ def print_report(result: dict):
 
 
 def main():
+    # Windows cp949 인코딩 문제 해결 (스크립트 실행 시에만 - 라이브러리 import 시 stdout 유지)
+    if sys.stdout and hasattr(sys.stdout, 'buffer'):
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
     if len(sys.argv) < 2:
         print("사용법: python validate_function_failure_mapping.py <excel_file>")
         print("예시: python validate_function_failure_mapping.py 철심_FMEA.xlsx")
@@ -316,7 +409,7 @@ def main():
     print_report(result)
 
     print("\n[JSON Output]")
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    print(dumps_json(result))
 
     if result["status"] == "pass":
         sys.exit(0)
@@ -12,21 +12,46 @@ FMEA Excel 검증: S값 범위별 고장영향 분포 확인
 Usage:
     python validate_lifecycle_coverage.py <excel_file>
     python validate_lifecycle_coverage.py CORE_FMEA.xlsx
+    python validate_lifecycle_coverage.py <directory>   # 폴더 내 *.xlsx 일괄 검증
+    python validate_lifecycle_coverage.py <excel_file> --json-only   # 보고서 생략, JSON만 출력
+    python validate_lifecycle_coverage.py <excel_file> --no-cache    # 결과 캐시 미사용
 
 Returns:
     - Pass: exit code 0, JSON {"status": "pass", "s_distribution": {...}}
     - Warning: exit code 0, JSON {"status": "warning", "recommendations": [...]}
 """
 
+import os
 import sys
 import io
+import argparse
 import json
+import re
+import hashlib
+import tempfile
+import numpy as np
 import pandas as pd
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 from pathlib import Path
 
-# Windows cp949 인코딩 문제 해결
-if sys.stdout:
-    sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+from validation_utils import build_automaton, write_json
+
+# pyarrow (선택): 설치 시 고장영향 문자열 열을 Arrow 기반 string dtype으로 처리
+try:
+    import pyarrow  # noqa: F401
+    _TEXT_DTYPE = 'string[pyarrow]'
+except ImportError:
+    _TEXT_DTYPE = str
+
+# python-calamine (선택): 설치 시 Rust 기반 calamine으로 시트 읽기, 미설치 시 openpyxl read-only
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+# 시트 리더 이름 (결과 캐시 키에 포함 - 리더가 바뀌면 캐시 미사용)
+_SHEET_READER = 'calamine' if python_calamine is not None else 'openpyxl'
 
 # S값 범위 정의
 S_RANGES = {
@@ -50,6 +75,24 @@ S_RANGES = {
     }
 }
 
+# 범위별 예시 항목 수 (마스크에서 앞쪽 인덱스만 잘라 사용 - 행 루프 내 개수 검사 없음)
+_SAMPLE_ITEMS_PER_RANGE = 3
+
+# 발견 장소 이슈 보관 개수 (보고서 출력 개수와 동일, 전체 건수는 discovery_location_issue_count)
+_MAX_DISCOVERY_ISSUES = 5
+
+# (범위 이름, 설정) 출력 순서 - 보고/권장사항 루프에서 S_RANGES 재조회 생략
+_RANGE_ORDER = tuple((range_name, S_RANGES[range_name]) for range_name in ('low', 'medium', 'high'))
+
+# S값 범위 경계 (np.digitize 구간 번호: 1=low, 2=medium, 3=high, 0/4=범위 밖 또는 NaN)
+_S_RANGE_BINS = np.array([1, 6, 8, 11])
+_S_RANGE_CODES = (('low', 1), ('medium', 2), ('high', 3))
+
+# 헤더 셀 문자열 (intern: 헤더 탐색 시 동일성 비교)
+_EFFECT_HEADER = sys.intern('고장영향')
+_S_HEADER = sys.intern('S')
+_MAX_HEADER_LEN = max(len(_EFFECT_HEADER), len(_S_HEADER))
+
 # 발견 장소 패턴 (고장영향에서 제거 권장)
 DISCOVERY_LOCATION_PATTERNS = [
     '조립 불합격', '조립불합격',
@@ -63,6 +106,15 @@ DISCOVERY_LOCATION_PATTERNS = [
 ]
 
 
+# 발견 장소 패턴 단일 Aho-Corasick 오토마톤 (값 = 패턴 인덱스)
+_DISCOVERY_AUTOMATON = build_automaton((pattern, idx) for idx, pattern in enumerate(DISCOVERY_LOCATION_PATTERNS))
+
+# 전체 발견 장소 패턴 단일 정규식 (열 단위 1차 필터, Aho-Corasick 미설치 시 행 단위 1차 필터)
+# 겹치는 출현을 놓치지 않도록 패턴 목록 추출은 필터 통과 문자열에만 별도 수행
+_DISCOVERY_RE = re.compile('|'.join(re.escape(pattern) for pattern in DISCOVERY_LOCATION_PATTERNS))
+
+
+@lru_cache(maxsize=32)
 def classify_s_range(s_value) -> str:
     """
     S값을 범위별로 분류.
@@ -73,21 +125,27 @@ def classify_s_range(s_value) -> str:
     Returns:
         범위 이름: 'low', 'medium', 'high', or 'invalid'
     """
-    if pd.isna(s_value):
-        return 'invalid'
+    # validate_s_distribution과 같은 변환 규칙 (_s_numbers)
+    s = _s_numbers([s_value])[0]
 
-    try:
-        s = int(s_value)
-        if s < 1 or s > 10:
-            return 'invalid'
-        elif s <= 5:
-            return 'low'
-        elif s <= 7:
-            return 'medium'
-        else:
-            return 'high'
-    except (ValueError, TypeError):
+    if np.isnan(s) or s < 1 or s > 10:
         return 'invalid'
+    elif s <= 5:
+        return 'low'
+    elif s <= 7:
+        return 'medium'
+    else:
+        return 'high'
+
+
+def _s_numbers(s_values: list) -> np.ndarray:
+    """
+    S값 목록을 float 배열로 일괄 변환 (pd.to_numeric 1회, 소수점 이하 버림)
+
+    숫자로 해석되지 않는 값(빈 값, 일반 문자열 등)은 NaN -> 범위 마스크에서 제외
+    """
+    numbers = pd.to_numeric(pd.Series(s_values, dtype=object), errors='coerce')
+    return np.trunc(numbers.to_numpy(dtype=float))
 
 
 def check_discovery_location(effect_value: str) -> list:
@@ -103,20 +161,119 @@ def check_discovery_location(effect_value: str) -> list:
     if pd.isna(effect_value) or str(effect_value).strip() == '':
         return []
 
-    effect_str = str(effect_value).strip()
-    found_patterns = []
+    return list(_discovery_patterns(str(effect_value).strip()))
+
+
+@lru_cache(maxsize=4096)
+def _discovery_patterns(effect_str: str) -> tuple:
+    """
+    check_discovery_location 본체 (strip된 문자열 입력, 결과 캐시)
+
+    같은 고장영향 문구가 여러 행에 반복되므로 패턴 검사는 문구당 1회
+    """
+    # 패턴 목록 순서로 정렬, 같은 패턴 반복 출현은 1회
+    if _DISCOVERY_AUTOMATON is not None:
+        hits = sorted({idx for _, idx in _DISCOVERY_AUTOMATON.iter(effect_str)})
+        return tuple(DISCOVERY_LOCATION_PATTERNS[idx] for idx in hits)
+
+    if _DISCOVERY_RE.search(effect_str) is None:
+        return ()
+    return tuple(pattern for pattern in DISCOVERY_LOCATION_PATTERNS if pattern in effect_str)
+
+
+def _convert_cell(value):
+    """
+    셀 값 정규화 (pandas read_excel과 동일 규칙)
+
+    빈 문자열(calamine 빈 셀) -> None, 정수값 float -> int
+    """
+    if value == '':
+        return None
+    if isinstance(value, float) and value.is_integer():
+        return int(value)
+    return value
+
+
+def _read_sheet_rows(file_path: str, sheet_name: str = 'FMEA') -> list:
+    """
+    시트의 전체 행을 값 리스트로 읽기 (DataFrame 미생성)
+
+    python-calamine 설치 시 calamine, 미설치 시 openpyxl read-only 스트리밍 사용
+    """
+    if python_calamine is not None:
+        # calamine은 파일 없음을 자체 예외로 보고 -> FileNotFoundError로 통일
+        if not Path(file_path).is_file():
+            raise FileNotFoundError(file_path)
+        workbook = python_calamine.CalamineWorkbook.from_path(file_path)
+        return workbook.get_sheet_by_name(sheet_name).to_python(skip_empty_area=False)
+
+    from openpyxl import load_workbook
+    wb = load_workbook(file_path, read_only=True, data_only=True)
+    try:
+        return [list(row) for row in wb[sheet_name].iter_rows(values_only=True)]
+    finally:
+        wb.close()
+
+
+# 검증 결과 캐시 폴더 - (파일 경로, 수정 시각, 크기, 스크립트 수정 시각) 키로 변경 없는 파일 재검증 생략
+_RESULT_CACHE_DIR = Path.home() / '.cache' / 'fmea_validate'
+
+# 설정 시(값 무관) 결과 캐시를 읽지도 쓰지도 않음 (--no-cache가 설정 - 작업 프로세스에도 상속)
+_NO_CACHE_ENV = 'FMEA_VALIDATE_NO_CACHE'
 
-    for pattern in DISCOVERY_LOCATION_PATTERNS:
-        if pattern in effect_str:
-            found_patterns.append(pattern)
 
-    return found_patterns
+def _result_cache_enabled() -> bool:
+    """결과 캐시 사용 여부 (환경 변수 FMEA_VALIDATE_NO_CACHE가 비어 있거나 없을 때만 사용)"""
+    return not os.environ.get(_NO_CACHE_ENV)
+
+
+def _result_cache_path(file_path: str):
+    """검증 결과 캐시 파일 경로 (파일 정보를 읽을 수 없으면 None)"""
+    try:
+        stat = os.stat(file_path)
+        script_mtime = os.stat(__file__).st_mtime_ns
+    except OSError:
+        return None
+    key = f"{Path(file_path).resolve()}|{stat.st_mtime_ns}|{stat.st_size}|{script_mtime}|{_SHEET_READER}"
+    return _RESULT_CACHE_DIR / f"{hashlib.sha1(key.encode('utf-8')).hexdigest()}.json"
+
+
+def _load_cached_result(cache_path):
+    """캐시된 검증 결과 읽기 (없거나 손상되면 None)"""
+    if cache_path is None:
+        return None
+    try:
+        with open(cache_path, encoding='utf-8') as f:
+            return json.load(f)
+    except (OSError, ValueError):
+        return None
+
+
+def _store_cached_result(cache_path, result: dict):
+    """검증 결과를 임시 파일에 쓴 뒤 교체 (동시 실행 시 반쯤 쓰인 캐시 방지, 실패는 무시)"""
+    if cache_path is None:
+        return
+    try:
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        fd, tmp_path = tempfile.mkstemp(dir=cache_path.parent, suffix='.tmp')
+        try:
+            with os.fdopen(fd, 'w', encoding='utf-8') as f:
+                json.dump(result, f, ensure_ascii=False)
+            os.replace(tmp_path, cache_path)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    except OSError:
+        pass
 
 
 def validate_s_distribution(file_path: str) -> dict:
     """
     FMEA Excel 파일의 S값 범위 분포 검증.
 
+    수정 시각/크기와 시트 리더가 같은 파일은 ~/.cache/fmea_validate 의 캐시 결과를 반환
+    (오류 결과는 캐시하지 않음, FMEA_VALIDATE_NO_CACHE 설정 시 캐시 미사용)
+
     Returns:
         {
             "status": "pass" | "warning" | "error",
@@ -126,10 +283,24 @@ def validate_s_distribution(file_path: str) -> dict:
                 "medium": {"count": int, "percentage": float, "items": [...]},
                 "high": {"count": int, "percentage": float, "items": [...]}
             },
-            "discovery_location_issues": [...],
+            "discovery_location_issues": [...],  (앞쪽 _MAX_DISCOVERY_ISSUES건만)
+            "discovery_location_issue_count": int,
             "recommendations": [...]
         }
     """
+    cache_path = _result_cache_path(file_path) if _result_cache_enabled() else None
+    result = _load_cached_result(cache_path)
+    if result is not None:
+        return result
+
+    result = _validate_s_distribution(file_path)
+    if result["status"] != "error":
+        _store_cached_result(cache_path, result)
+    return result
+
+
+def _validate_s_distribution(file_path: str) -> dict:
+    """validate_s_distribution() 본체 (캐시 미사용)"""
     result = {
         "status": "pass",
         "total_rows": 0,
@@ -140,27 +311,41 @@ def validate_s_distribution(file_path: str) -> dict:
             "high": {"count": 0, "percentage": 0.0, "items": []}
         },
         "discovery_location_issues": [],
+        "discovery_location_issue_count": 0,
         "recommendations": []
     }
 
     try:
-        df = pd.read_excel(file_path, sheet_name='FMEA', header=None)
-        result["total_rows"] = len(df)
+        # 고장영향/S 두 열만 사용하므로 DataFrame 대신 행 값 리스트로 읽기
+        rows = _read_sheet_rows(file_path)
+        result["total_rows"] = len(rows)
 
         # 헤더 행 찾기
         effect_col = None  # C열 (고장영향)
         s_col = None       # D열 (S값)
         header_row = None
 
-        for i in range(min(10, len(df))):
-            row = df.iloc[i]
+        for i, row in enumerate(rows[:10]):
+            s_in_row = False
             for j, val in enumerate(row):
-                val_str = str(val).strip()
-                if val_str == '고장영향':
+                # 헤더는 문자열 셀만 가능 (숫자/빈 셀은 str 변환 생략)
+                if not isinstance(val, str):
+                    continue
+                val_str = val.strip()
+                if len(val_str) > _MAX_HEADER_LEN:
+                    continue
+                # 짧은 셀만 intern -> 헤더 상수와 동일성(is) 비교
+                val_str = sys.intern(val_str)
+                if val_str is _EFFECT_HEADER:
                     effect_col = j
                     header_row = i
-                elif val_str == 'S':
+                elif val_str is _S_HEADER:
                     s_col = j
+                    s_in_row = True
+                # 헤더 행에서 두 열을 모두 찾으면 나머지 열은 생략
+                # (우측의 조치 후 S 열은 분포 대상이 아님)
+                if effect_col is not None and s_in_row:
+                    break
             if effect_col is not None:
                 break
 
@@ -180,35 +365,58 @@ def validate_s_distribution(file_path: str) -> dict:
                 "discovery_location_issues": []
             }
 
-        # 각 데이터 행 분석
-        for i in range(header_row + 1, len(df)):
-            effect_value = df.iloc[i, effect_col]
-            s_value = df.iloc[i, s_col]
+        # 데이터 행에서 고장영향이 있는 행만 추출 (행 번호, 고장영향, S값)
+        row_numbers = []
+        effects = []
+        s_values = []
+        for i in range(header_row + 1, len(rows)):
+            row = rows[i]
+            effect_value = _convert_cell(row[effect_col]) if effect_col < len(row) else None
 
             if pd.isna(effect_value) or str(effect_value).strip() == '':
                 continue
 
-            result["checked_rows"] += 1
-
-            # S값 범위 분류
-            s_range = classify_s_range(s_value)
-            if s_range in result["s_distribution"]:
-                result["s_distribution"][s_range]["count"] += 1
-                if len(result["s_distribution"][s_range]["items"]) < 3:
-                    result["s_distribution"][s_range]["items"].append({
-                        "row": i + 1,
-                        "effect": str(effect_value)[:40],
-                        "s_value": int(s_value) if not pd.isna(s_value) else None
-                    })
+            row_numbers.append(i + 1)
+            effects.append(effect_value)
+            s_values.append(_convert_cell(row[s_col]) if s_col < len(row) else None)
+
+        result["checked_rows"] = len(effects)
+
+        # S값 범위 분류 (숫자 배열 1회 변환 -> digitize 1회로 구간 번호 -> bincount로 개수 집계)
+        s_numbers = _s_numbers(s_values)
+        range_codes = np.digitize(s_numbers, _S_RANGE_BINS)
+        range_counts = np.bincount(range_codes, minlength=len(_S_RANGE_BINS) + 1)
+        for range_name, code in _S_RANGE_CODES:
+            bucket = result["s_distribution"][range_name]
+            bucket["count"] = int(range_counts[code])
+            for k in np.flatnonzero(range_codes == code)[:_SAMPLE_ITEMS_PER_RANGE]:
+                bucket["items"].append({
+                    "row": row_numbers[k],
+                    "effect": str(effects[k])[:40],
+                    "s_value": int(s_numbers[k])
+                })
 
-            # 발견 장소 패턴 검출
-            discovery_patterns = check_discovery_location(effect_value)
+        # 발견 장소 패턴 검출 (문자열 변환 후 단일 정규식으로 열 전체 1차 필터,
+        # strip/40자 자르기/패턴 목록 추출은 필터 통과 행에만)
+        effect_texts = pd.Series(effects, dtype=object).astype(_TEXT_DTYPE)
+        hit_mask = effect_texts.str.contains(_DISCOVERY_RE.pattern, regex=True).to_numpy(dtype=bool)
+        hit_texts = effect_texts[hit_mask]
+        hit_rows = [row_numbers[k] for k in np.flatnonzero(hit_mask)]
+        stripped_texts = hit_texts.str.strip().tolist()
+        short_texts = hit_texts.str.slice(0, 40).tolist()
+        discovery_issues = result["discovery_location_issues"]
+        issue_count = 0
+        for row_no, effect_str, short_text in zip(hit_rows, stripped_texts, short_texts):
+            discovery_patterns = _discovery_patterns(effect_str)
             if discovery_patterns:
-                result["discovery_location_issues"].append({
-                    "row": i + 1,
-                    "effect": str(effect_value)[:40],
-                    "patterns": discovery_patterns
-                })
+                issue_count += 1
+                if len(discovery_issues) < _MAX_DISCOVERY_ISSUES:
+                    discovery_issues.append({
+                        "row": row_no,
+                        "effect": short_text,
+                        "patterns": list(discovery_patterns)
+                    })
+        result["discovery_location_issue_count"] = issue_count
 
         # 비율 계산
         total_checked = result["checked_rows"]
@@ -218,16 +426,15 @@ def validate_s_distribution(file_path: str) -> dict:
                 result["s_distribution"][range_name]["percentage"] = round(count / total_checked * 100, 1)
 
         # 권장사항 생성
-        for range_name, data in result["s_distribution"].items():
-            if data["count"] == 0:
-                config = S_RANGES[range_name]
+        for range_name, config in _RANGE_ORDER:
+            if result["s_distribution"][range_name]["count"] == 0:
                 result["recommendations"].append(
                     f"{config['korean_name']} 항목 추가 필요 ({config['display_name']})"
                 )
 
-        if result["discovery_location_issues"]:
+        if issue_count:
             result["recommendations"].append(
-                f"발견 장소 패턴 {len(result['discovery_location_issues'])}건 검토 필요 (고장영향 != 발견 장소)"
+                f"발견 장소 패턴 {issue_count}건 검토 필요 (고장영향 != 발견 장소)"
             )
 
         # 상태 결정
@@ -271,8 +478,8 @@ def print_report(result: dict):
     print("\n[S값 분포 SUMMARY]")
     print("-" * 50)
 
-    for range_name, data in result["s_distribution"].items():
-        config = S_RANGES[range_name]
+    for range_name, config in _RANGE_ORDER:
+        data = result["s_distribution"][range_name]
         status = "OK" if data["count"] > 0 else "MISSING"
         print(f"  {config['display_name']:20} | {data['count']:3} items ({data['percentage']:5.1f}%) | {status}")
 
@@ -286,11 +493,12 @@ def print_report(result: dict):
     if result["discovery_location_issues"]:
         print("\n[발견 장소 패턴 검출] - 고장영향이 아닌 발견 장소일 수 있음")
         print("-" * 50)
-        for issue in result["discovery_location_issues"][:5]:
+        for issue in result["discovery_location_issues"]:
             print(f"  Row {issue['row']}: \"{issue['effect']}\"")
             print(f"         패턴: {', '.join(issue['patterns'])}")
-        if len(result["discovery_location_issues"]) > 5:
-            print(f"  ... 외 {len(result['discovery_location_issues']) - 5}건")
+        remaining = result["discovery_location_issue_count"] - len(result["discovery_location_issues"])
+        if remaining > 0:
+            print(f"  ... 외 {remaining}건")
         print()
         print("  [참고] 고장영향 = 기능 실패의 결과 (인과관계 필수)")
         print("         '조립 불합격', 'FAT 불합격'은 발견 장소이지 기능 실패 결과가 아님")
@@ -311,27 +519,108 @@ def print_report(result: dict):
     print("=" * 70)
 
 
+def validate_directory(dir_path: str) -> dict:
+    """
+    폴더 내 모든 *.xlsx 파일의 S값 분포 검증.
+
+    파일별 검증은 서로 독립이므로 파일이 2개 이상이고 CPU가 여러 개면
+    ProcessPoolExecutor로 분산 (Excel 파싱이 CPU 위주)
+
+    Returns:
+        {
+            "status": 파일별 결과 중 가장 심각한 상태 (error > warning > pass),
+                      *.xlsx 파일이 없으면 "error" (잘못된 폴더가 통과로 보고되지 않도록)
+            "file_count": int,
+            "files": {파일명: validate_s_distribution() 결과}
+        }
+    """
+    files = sorted(str(path) for path in Path(dir_path).glob('*.xlsx')
+                   if not path.name.startswith('~$'))
+
+    if not files:
+        return {
+            "status": "error",
+            "message": f"폴더에 *.xlsx 파일이 없습니다: {dir_path}",
+            "file_count": 0,
+            "files": {}
+        }
+
+    if len(files) < 2 or (os.cpu_count() or 1) < 2:
+        results = list(map(validate_s_distribution, files))
+    else:
+        with ProcessPoolExecutor() as executor:
+            results = list(executor.map(validate_s_distribution, files))
+
+    statuses = {result["status"] for result in results}
+    if "error" in statuses:
+        status = "error"
+    elif "warning" in statuses:
+        status = "warning"
+    else:
+        status = "pass"
+
+    return {
+        "status": status,
+        "file_count": len(files),
+        "files": {Path(file).name: result for file, result in zip(files, results)}
+    }
+
+
 def main():
-    if len(sys.argv) < 2:
-        print("사용법: python validate_lifecycle_coverage.py <excel_file>")
-        print("예시: python validate_lifecycle_coverage.py CORE_FMEA.xlsx")
-        print()
-        print("검증 항목:")
-        print("  1. S값 범위별 분포 (S=2-5 / S=6-7 / S=8-10)")
-        print("  2. 발견 장소 패턴 검출 (조립 불합격, FAT 불합격 등)")
-        print()
-        print("기준: 회의 합의 260109")
-        print("  - 고장영향 = 기능 실패의 결과 (인과관계 필수)")
-        print("  - 발견 시점은 S값으로 반영")
+    # Windows cp949 인코딩 문제 해결 (스크립트 실행 시에만 - 라이브러리 import/작업 프로세스는 stdout 유지)
+    if sys.stdout and hasattr(sys.stdout, 'buffer'):
+        sys.stdout = io.TextIOWrapper(sys.stdout.buffer, encoding='utf-8', errors='replace')
+
+    parser = argparse.ArgumentParser(
+        description='S값 범위 분포 검증 (S=2-5 / S=6-7 / S=8-10)',
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+예시:
+  python validate_lifecycle_coverage.py CORE_FMEA.xlsx
+  python validate_lifecycle_coverage.py ./FMEA_결과/   (폴더 내 *.xlsx 일괄 검증)
+  python validate_lifecycle_coverage.py CORE_FMEA.xlsx --json-only
+
+검증 항목:
+  1. S값 범위별 분포 (S=2-5 / S=6-7 / S=8-10)
+  2. 발견 장소 패턴 검출 (조립 불합격, FAT 불합격 등)
+
+기준: 회의 합의 260109
+  - 고장영향 = 기능 실패의 결과 (인과관계 필수)
+  - 발견 시점은 S값으로 반영
+        """
+    )
+    parser.add_argument('path', nargs='?', help='FMEA Excel 파일 또는 *.xlsx 폴더')
+    parser.add_argument('--json-only', dest='json_only', action='store_true',
+                        help='보고서 출력 생략, JSON 결과만 출력 (CI 용)')
+    parser.add_argument('--no-cache', dest='no_cache', action='store_true',
+                        help=f'~/.cache/fmea_validate 결과 캐시 미사용 (환경 변수 {_NO_CACHE_ENV}=1 과 동일)')
+    args = parser.parse_args()
+
+    if args.no_cache:
+        # 폴더 모드 작업 프로세스도 환경 변수를 상속
+        os.environ[_NO_CACHE_ENV] = '1'
+
+    if args.path is None:
+        parser.print_help()
         sys.exit(1)
 
-    file_path = sys.argv[1]
-    result = validate_s_distribution(file_path)
-
-    print_report(result)
+    file_path = args.path
+    if Path(file_path).is_dir():
+        result = validate_directory(file_path)
+        if not args.json_only:
+            if not result["files"]:
+                print(f"[ERROR] {result['message']}")
+            for file_name, file_result in result["files"].items():
+                print(f"\n##### {file_name} #####")
+                print_report(file_result)
+    else:
+        result = validate_s_distribution(file_path)
+        if not args.json_only:
+            print_report(result)
 
-    print("\n[JSON Output]")
-    print(json.dumps(result, ensure_ascii=False, indent=2))
+    if not args.json_only:
+        print("\n[JSON Output]")
+    write_json(result)
 
     if result["status"] == "error":
         sys.exit(1)
@@ -15,13 +15,36 @@ H열(현재예방대책) / J열(현재검출대책) 검증 스크립트
     python validate_prevention_detection.py 단자_FMEA.xlsx
 """
 
+import os
 import sys
 import re
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
+from itertools import chain
 from pathlib import Path
-from typing import Tuple, List, Dict, Any
+from typing import Tuple, List, Dict, Any, Optional
+import numpy as np
 import pandas as pd
 
+from validation_utils import build_automaton, load_pickle_cache, save_pickle_cache
 
+# python-calamine (선택): 설치 시 Rust 기반 calamine 엔진으로 시트 읽기, 미설치 시 pandas 기본(openpyxl)
+try:
+    import python_calamine
+except ImportError:
+    python_calamine = None
+
+_EXCEL_ENGINE = 'calamine' if python_calamine is not None else None
+
+
+# 온톨로지 섹션 헤더 접두어
+_SECTION_PREFIX = '## SECTION:'
+
+# 온톨로지 파싱 캐시 형식 버전 (result/캐시 구조 변경 시 증가)
+_ONTOLOGY_CACHE_VERSION = 2
+
+
+@lru_cache(maxsize=1)
 def load_prevention_detection_ontology() -> dict:
     """
     prevention-detection-ontology.md에서 검증 규칙 로드
@@ -65,107 +88,89 @@ def load_prevention_detection_ontology() -> dict:
         result['abbreviation_map'] = {'CS': 'CHECK SHEET'}
         return result
 
-    content = ontology_path.read_text(encoding='utf-8')
-
-    # 섹션별 파싱
-    sections = re.split(r'\n## SECTION:', content)
+    # 파싱 캐시: 온톨로지 파일의 mtime/크기가 그대로면 재사용
+    cache_path = ontology_path.with_suffix('.md.pkl')
+    cached = load_pickle_cache(ontology_path, cache_path, _ONTOLOGY_CACHE_VERSION)
+    if cached is not None:
+        return cached
+
+    def add_keywords(key: str, line: str, stripped: str):
+        # "카테고리: 키워드1, 키워드2" 형식
+        if ':' in line and not line.startswith('#'):
+            _, patterns = line.split(':', 1)
+            result[key].extend([p.strip() for p in patterns.split(',') if p.strip()])
+
+    def add_mapping(key: str, line: str, stripped: str):
+        # "이름: 값" 형식
+        if ':' in line and not line.startswith('#'):
+            name, value = line.split(':', 1)
+            result[key][name.strip()] = value.strip()
+
+    def add_source_pattern(line: str, stripped: str):
+        # ### <카테고리> 하위에 "이름: 패턴1, 패턴2" 라인
+        nonlocal current_category
+        if line.startswith('### '):
+            category = line.replace('### ', '').strip().lower()
+            if '내부' in category:
+                current_category = 'internal'
+            elif '외부' in category:
+                current_category = 'external'
+            elif '일반' in category:
+                current_category = 'general'
+        elif ':' in line and current_category and not line.startswith('#'):
+            _, patterns = line.split(':', 1)
+            result['source_patterns'][current_category].extend(
+                [p.strip() for p in patterns.split(',') if p.strip()]
+            )
+
+    section_handlers = {
+        'SOURCE_PATTERNS': add_source_pattern,
+        'FORBIDDEN_SOURCE_PATTERNS': lambda line, stripped: add_keywords('forbidden_source', line, stripped),
+        'REQUIRED_VALUE_PATTERNS': lambda line, stripped: add_keywords('required_value_patterns', line, stripped),
+        'VALUE_FORMAT_EXAMPLES': lambda line, stripped: add_keywords('value_examples', line, stripped),
+        'FORBIDDEN_VAGUE_EXPRESSIONS': lambda line, stripped: add_keywords('forbidden_vague', line, stripped),
+        'ABBREVIATION_MAP': lambda line, stripped: add_mapping('abbreviation_map', line, stripped),
+        'SEVERITY_LEVELS': lambda line, stripped: add_mapping('severity_levels', line, stripped),
+    }
 
-    for section in sections:
-        lines = section.strip().split('\n')
-        if not lines:
-            continue
+    # SECTION 기반 단일 패스 파싱 (줄 단위 상태 머신)
+    # REQUIRED_STAGES는 첫 값 라인에서, 나머지 섹션은 '---' 종료 마커에서 섹션 종료
+    current_section = None
+    current_category = None
+    section_closed = False
+
+    # 파일 전체를 읽지 않고 줄 단위로 스트리밍
+    with ontology_path.open(encoding='utf-8') as f:
+        for raw_line in f:
+            line = raw_line.rstrip('\n')
+            if line.startswith(_SECTION_PREFIX):
+                current_section = line[len(_SECTION_PREFIX):].strip()
+                current_category = None
+                section_closed = False
+                continue
+
+            if current_section is None or section_closed:
+                continue
+
+            stripped = line.strip()
+
+            if current_section == 'REQUIRED_STAGES':
+                if stripped and not line.startswith(('#', '-')):
+                    result['required_stages'] = [s.strip() for s in line.split(',') if s.strip()]
+                    section_closed = True
+                continue
 
-        section_name = lines[0].strip()
+            handler = section_handlers.get(current_section)
+            if handler is None:
+                continue
 
-        # REQUIRED_STAGES
-        if section_name == 'REQUIRED_STAGES':
-            for line in lines[1:]:
-                if line.strip() and not line.startswith('#') and not line.startswith('-'):
-                    result['required_stages'] = [s.strip() for s in line.split(',') if s.strip()]
-                    break
+            if stripped.startswith('---'):
+                section_closed = True
+                continue
 
-        # SOURCE_PATTERNS
-        elif section_name == 'SOURCE_PATTERNS':
-            current_category = None
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if line.startswith('### '):
-                    category = line.replace('### ', '').strip().lower()
-                    if '내부' in category:
-                        current_category = 'internal'
-                    elif '외부' in category:
-                        current_category = 'external'
-                    elif '일반' in category:
-                        current_category = 'general'
-                elif ':' in line and current_category and not line.startswith('#'):
-                    _, patterns = line.split(':', 1)
-                    result['source_patterns'][current_category].extend(
-                        [p.strip() for p in patterns.split(',') if p.strip()]
-                    )
-
-        # FORBIDDEN_SOURCE_PATTERNS
-        elif section_name == 'FORBIDDEN_SOURCE_PATTERNS':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    _, patterns = line.split(':', 1)
-                    result['forbidden_source'].extend(
-                        [p.strip() for p in patterns.split(',') if p.strip()]
-                    )
-
-        # REQUIRED_VALUE_PATTERNS
-        elif section_name == 'REQUIRED_VALUE_PATTERNS':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    _, patterns = line.split(':', 1)
-                    result['required_value_patterns'].extend(
-                        [p.strip() for p in patterns.split(',') if p.strip()]
-                    )
-
-        # VALUE_FORMAT_EXAMPLES
-        elif section_name == 'VALUE_FORMAT_EXAMPLES':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    _, examples = line.split(':', 1)
-                    result['value_examples'].extend(
-                        [e.strip() for e in examples.split(',') if e.strip()]
-                    )
-
-        # FORBIDDEN_VAGUE_EXPRESSIONS
-        elif section_name == 'FORBIDDEN_VAGUE_EXPRESSIONS':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    _, patterns = line.split(':', 1)
-                    result['forbidden_vague'].extend(
-                        [p.strip() for p in patterns.split(',') if p.strip()]
-                    )
-
-        # ABBREVIATION_MAP
-        elif section_name == 'ABBREVIATION_MAP':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    abbr, full = line.split(':', 1)
-                    result['abbreviation_map'][abbr.strip()] = full.strip()
-
-        # SEVERITY_LEVELS
-        elif section_name == 'SEVERITY_LEVELS':
-            for line in lines[1:]:
-                if line.strip().startswith('---'):
-                    break
-                if ':' in line and not line.startswith('#'):
-                    level, desc = line.split(':', 1)
-                    result['severity_levels'][level.strip()] = desc.strip()
+            handler(line, stripped)
 
+    save_pickle_cache(ontology_path, cache_path, _ONTOLOGY_CACHE_VERSION, result)
     return result
 
 
@@ -173,61 +178,90 @@ def load_prevention_detection_ontology() -> dict:
 _ontology = load_prevention_detection_ontology()
 
 REQUIRED_STAGES = _ontology['required_stages']
+REQUIRED_STAGES_SET = frozenset(REQUIRED_STAGES)  # 단계 유효성 검사용 (REQUIRED_STAGES는 메시지 표시용)
 SOURCE_PATTERNS = _ontology['source_patterns']
 FORBIDDEN_SOURCE = _ontology['forbidden_source']
 REQUIRED_VALUE_PATTERNS = _ontology['required_value_patterns']
 FORBIDDEN_VAGUE = _ontology['forbidden_vague']
 ABBREVIATION_MAP = _ontology['abbreviation_map']
 
+# 정규식 사전 컴파일 (셀마다 re 모듈 캐시 조회 생략)
+_PAREN_RE = re.compile(r'\(([^)]+)\)')
+_DIGIT_RE = re.compile(r'\d+')
+_ABBR_RES = {abbr: re.compile(rf'\b{re.escape(abbr)}\b') for abbr in ABBREVIATION_MAP}
 
-def validate_stage_format(value: str) -> Tuple[bool, str]:
-    """
-    [단계]: [대책] 형식 검증
-    """
-    if pd.isna(value) or str(value).strip() == '':
-        return False, "[ERROR] 빈 값"
 
-    value_str = str(value).strip()
+def _build_automaton(patterns: List[str]):
+    """패턴 목록을 단일 Aho-Corasick 오토마톤으로 컴파일 (값 = 패턴 인덱스, 미설치/빈 목록은 None)"""
+    return build_automaton((pattern, idx) for idx, pattern in enumerate(patterns))
+
+
+def _matched_patterns(automaton, patterns: List[str], text: str) -> List[str]:
+    """text에 포함된 패턴 목록 (패턴 목록 순서, 중복 제거)"""
+    if automaton is not None:
+        return [patterns[idx] for idx in sorted({idx for _, idx in automaton.iter(text)})]
+    return [pattern for pattern in patterns if pattern in text]
+
+
+_FORBIDDEN_SOURCE_AC = _build_automaton(FORBIDDEN_SOURCE)
+
+
+def _compile_alternation(patterns: List[str]) -> Optional[re.Pattern]:
+    """부분 문자열 패턴 목록을 단일 정규식 alternation으로 컴파일 (빈 목록이면 None)"""
+    if not patterns:
+        return None
+    return re.compile('|'.join(map(re.escape, patterns)))
+
+
+# 출처 분류별 단일 정규식 (내부문서/외부표준 패턴 중 하나라도 포함 여부를 1회 검색)
+_INTERNAL_SOURCE_RE = _compile_alternation(SOURCE_PATTERNS['internal'])
+_EXTERNAL_SOURCE_RE = _compile_alternation(SOURCE_PATTERNS['external'])
+
+# 숫자 없는 줄 중 모호한 표현이 있는 줄 (셀 전체 1회 검색, 표현 목록이 비면 None)
+_VAGUE_LINE_RE = (
+    re.compile(r'(?m)^(?=[^\n]*(?:' + '|'.join(map(re.escape, FORBIDDEN_VAGUE)) + r'))(?![^\n]*\d).*$')
+    if FORBIDDEN_VAGUE else None
+)
 
+# 기준값 단위 단일 정규식 (단위 중 하나라도 포함 여부를 1회 검색)
+_UNIT_RE = _compile_alternation(REQUIRED_VALUE_PATTERNS)
+_FORBIDDEN_VAGUE_AC = _build_automaton(FORBIDDEN_VAGUE)
+
+
+def _cell_text(value) -> Optional[str]:
+    """셀 값의 문자열 (NaN/None/공백 문자열이면 None - str 변환/strip 검사는 1회)"""
+    if isinstance(value, str):
+        value_str = value
+    elif value is None or value is pd.NA or value != value:
+        # 스칼라 결측 직접 판정 (NaN/NaT는 자기 자신과 같지 않음 - pd.isna 범용 디스패치 생략)
+        return None
+    else:
+        value_str = str(value)
+    return value_str if value_str.strip() else None
+
+
+def _check_stage_format(value_str: str) -> Tuple[bool, str]:
+    """[단계]: [대책] 형식 검사 본체 (strip된 비어있지 않은 문자열)"""
     # : 가 있는지 확인
     if ':' not in value_str:
         return False, "[ERROR] '[단계]: [대책]' 형식 필요"
 
-    # 첫 번째 줄에서 단계 추출
-    first_line = value_str.split('\n')[0]
-    stage = first_line.split(':')[0].strip()
+    # 첫 번째 줄에서 단계 추출 (partition: 첫 구분자까지만 탐색, 나머지 줄/필드는 분할하지 않음)
+    stage = value_str.partition('\n')[0].partition(':')[0].strip()
 
     # 단계가 유효한지 확인
-    if stage not in REQUIRED_STAGES:
+    if stage not in REQUIRED_STAGES_SET:
         return False, f"[ERROR] 단계 '{stage}'는 {REQUIRED_STAGES} 중 하나여야 함"
 
     return True, "OK"
 
 
-def validate_source_presence(value: str) -> Tuple[bool, str, str]:
-    """
-    출처 존재 여부 검증
-
-    [!!] 핵심 규칙:
-    - 내부문서(IEQT-T-*, CHECK SHEET) 출처: 필수 (ERROR)
-    - 외부표준(IEC, IEEE, CIGRE) 출처: 선택사항 (INFO)
-
-    Returns:
-        (is_valid, reason, severity)
-    """
-    if pd.isna(value) or str(value).strip() == '':
-        return False, "[ERROR] 빈 값", "ERROR"
-
-    value_str = str(value)
-
-    # 괄호 안 내용 추출
-    source_matches = re.findall(r'\(([^)]+)\)', value_str)
-
+def _check_source_presence(source_matches: List[str]) -> Tuple[bool, str, str]:
+    """출처 존재 검사 본체 (괄호 안 내용 목록)"""
     if not source_matches:
         return False, "[ERROR] 출처 없음 - (IEQT-T-W030 §3.2) 형식 필요", "ERROR"
 
     # 유효한 출처가 있는지 확인
-    valid_sources = []
     has_internal = False
     has_external = False
     has_general = False
@@ -235,26 +269,19 @@ def validate_source_presence(value: str) -> Tuple[bool, str, str]:
 
     for source in source_matches:
         # 내부문서 체크 (필수!)
-        for pattern in SOURCE_PATTERNS['internal']:
-            if pattern in source:
-                valid_sources.append(source)
-                has_internal = True
-                if '§' in source or 'No.' in source or '-' in source.split()[-1] if source.split() else False:
-                    has_section = True
-                break
+        if _INTERNAL_SOURCE_RE is not None and _INTERNAL_SOURCE_RE.search(source):
+            has_internal = True
+            if '§' in source or 'No.' in source or '-' in source.split()[-1] if source.split() else False:
+                has_section = True
 
         # 외부표준 체크 (선택사항)
-        for pattern in SOURCE_PATTERNS['external']:
-            if pattern in source:
-                valid_sources.append(source)
-                has_external = True
-                if '§' in source:
-                    has_section = True
-                break
+        if _EXTERNAL_SOURCE_RE is not None and _EXTERNAL_SOURCE_RE.search(source):
+            has_external = True
+            if '§' in source:
+                has_section = True
 
         # 일반 체크
         if source.strip() == '일반':
-            valid_sources.append(source)
             has_general = True
 
     # [!!] 출처 검증: WARNING 수준 (ERROR 아님!)
@@ -277,6 +304,101 @@ def validate_source_presence(value: str) -> Tuple[bool, str, str]:
     return True, "OK", "OK"
 
 
+def _check_forbidden_source(source_matches: List[str]) -> Tuple[bool, str]:
+    """금지 패턴 검사 본체 (괄호 안 내용 목록)"""
+    for source in source_matches:
+        # [!!] 문서번호가 있으면 금지 패턴 체크 건너뜀!
+        if 'IEQT-T' in source or 'CHECK SHEET' in source or 'CHECK_SHEET' in source:
+            continue
+
+        # 패턴 목록 순서상 첫 번째로 포함된 금지 패턴 기준
+        matched = _matched_patterns(_FORBIDDEN_SOURCE_AC, FORBIDDEN_SOURCE, source)
+        if not matched:
+            continue
+        forbidden = matched[0]
+        # 금지 패턴이 단독으로 사용된 경우만 ERROR
+        if forbidden == source.strip():
+            return False, f"[ERROR] 금지 패턴 '{forbidden}' 단독 사용 - 정확한 문서번호 필요"
+        # 금지 패턴이 문서번호 없이 포함된 경우
+        return False, f"[ERROR] 금지 패턴 '{forbidden}' 포함 - 정확한 문서번호 필요"
+
+    return True, "OK"
+
+
+def _check_abbreviation(value_str: str) -> Tuple[bool, str]:
+    """약어 사용 검사 본체"""
+    for abbr, full in ABBREVIATION_MAP.items():
+        # 정확한 약어 매칭 (예: CS가 단독으로 있는 경우)
+        if _ABBR_RES[abbr].search(value_str) and full not in value_str:
+            return False, f"[WARNING] 약어 '{abbr}' 사용 -> '{full}'로 변경 권장"
+
+    return True, "OK"
+
+
+def _check_value_presence(value_str: str, has_number: bool) -> Tuple[bool, str, str]:
+    """기준값 존재 검사 본체 (숫자 포함 여부는 호출 측에서 1회 계산)"""
+    # 단위가 있는지 확인
+    has_unit = _UNIT_RE is not None and _UNIT_RE.search(value_str) is not None
+
+    # 숫자와 단위 모두 있으면 OK
+    if has_number and has_unit:
+        return True, "OK", "OK"
+
+    # 숫자만 있고 단위 없음
+    if has_number and not has_unit:
+        return True, "[INFO] 단위 추가 권장", "INFO"
+
+    # 숫자 없음
+    return False, "[WARNING] 기준값 없음 - 정량적 수치(45±5 N.m, 110% 등) 필요", "WARNING"
+
+
+def _check_vague_expression(value_str: str) -> Tuple[bool, str]:
+    """모호한 표현 검사 본체"""
+    if _VAGUE_LINE_RE is None:
+        return True, "OK"
+
+    # 모호한 표현이 단독으로 사용된 경우 (같은 줄에 수치 없이)
+    # -> 해당 줄들에서 검출된 표현 중 목록 순서상 첫 번째 보고
+    found = set()
+    for line_match in _VAGUE_LINE_RE.finditer(value_str):
+        found.update(_matched_patterns(_FORBIDDEN_VAGUE_AC, FORBIDDEN_VAGUE, line_match.group()))
+    if found:
+        vague = next(vague for vague in FORBIDDEN_VAGUE if vague in found)
+        return False, f"[WARNING] 모호한 표현 '{vague}' - 구체적 수치 추가 필요"
+
+    return True, "OK"
+
+
+def validate_stage_format(value: str) -> Tuple[bool, str]:
+    """
+    [단계]: [대책] 형식 검증
+    """
+    value_str = _cell_text(value)
+    if value_str is None:
+        return False, "[ERROR] 빈 값"
+
+    return _check_stage_format(value_str.strip())
+
+
+def validate_source_presence(value: str) -> Tuple[bool, str, str]:
+    """
+    출처 존재 여부 검증
+
+    [!!] 핵심 규칙:
+    - 내부문서(IEQT-T-*, CHECK SHEET) 출처: 필수 (ERROR)
+    - 외부표준(IEC, IEEE, CIGRE) 출처: 선택사항 (INFO)
+
+    Returns:
+        (is_valid, reason, severity)
+    """
+    value_str = _cell_text(value)
+    if value_str is None:
+        return False, "[ERROR] 빈 값", "ERROR"
+
+    # 괄호 안 내용 추출
+    return _check_source_presence(_PAREN_RE.findall(value_str))
+
+
 def validate_forbidden_source(value: str) -> Tuple[bool, str]:
     """
     금지 패턴 검증 (일반 용어, 시리즈명, 약어)
@@ -285,45 +407,23 @@ def validate_forbidden_source(value: str) -> Tuple[bool, str]:
     - 문서번호(IEQT-T-*, CHECK SHEET) 포함 시 -> 금지 패턴 우회!
     - 금지 패턴 단독 사용 시에만 ERROR
     """
-    if pd.isna(value) or str(value).strip() == '':
+    value_str = _cell_text(value)
+    if value_str is None:
         return True, "빈 값"
 
-    value_str = str(value)
-
     # 괄호 안 내용에서 금지 패턴 체크
-    source_matches = re.findall(r'\(([^)]+)\)', value_str)
-
-    for source in source_matches:
-        # [!!] 문서번호가 있으면 금지 패턴 체크 건너뜀!
-        if 'IEQT-T' in source or 'CHECK SHEET' in source or 'CHECK_SHEET' in source:
-            continue
-
-        for forbidden in FORBIDDEN_SOURCE:
-            # 금지 패턴이 단독으로 사용된 경우만 ERROR
-            if forbidden == source.strip():
-                return False, f"[ERROR] 금지 패턴 '{forbidden}' 단독 사용 - 정확한 문서번호 필요"
-            # 금지 패턴이 문서번호 없이 포함된 경우
-            if forbidden in source:
-                return False, f"[ERROR] 금지 패턴 '{forbidden}' 포함 - 정확한 문서번호 필요"
-
-    return True, "OK"
+    return _check_forbidden_source(_PAREN_RE.findall(value_str))
 
 
 def validate_abbreviation(value: str) -> Tuple[bool, str]:
     """
     약어 사용 검증
     """
-    if pd.isna(value) or str(value).strip() == '':
+    value_str = _cell_text(value)
+    if value_str is None:
         return True, "빈 값"
 
-    value_str = str(value)
-
-    for abbr, full in ABBREVIATION_MAP.items():
-        # 정확한 약어 매칭 (예: CS가 단독으로 있는 경우)
-        if re.search(rf'\b{re.escape(abbr)}\b', value_str) and full not in value_str:
-            return False, f"[WARNING] 약어 '{abbr}' 사용 -> '{full}'로 변경 권장"
-
-    return True, "OK"
+    return _check_abbreviation(value_str)
 
 
 def validate_value_presence(value: str) -> Tuple[bool, str, str]:
@@ -333,48 +433,28 @@ def validate_value_presence(value: str) -> Tuple[bool, str, str]:
     Returns:
         (is_valid, reason, severity)
     """
-    if pd.isna(value) or str(value).strip() == '':
+    value_str = _cell_text(value)
+    if value_str is None:
         return False, "[ERROR] 빈 값", "ERROR"
 
-    value_str = str(value)
-
     # 숫자가 있는지 확인
-    has_number = bool(re.search(r'\d+', value_str))
-
-    # 단위가 있는지 확인
-    has_unit = any(unit in value_str for unit in REQUIRED_VALUE_PATTERNS)
-
-    # 숫자와 단위 모두 있으면 OK
-    if has_number and has_unit:
-        return True, "OK", "OK"
-
-    # 숫자만 있고 단위 없음
-    if has_number and not has_unit:
-        return True, "[INFO] 단위 추가 권장", "INFO"
-
-    # 숫자 없음
-    return False, "[WARNING] 기준값 없음 - 정량적 수치(45±5 N.m, 110% 등) 필요", "WARNING"
+    return _check_value_presence(value_str, bool(_DIGIT_RE.search(value_str)))
 
 
 def validate_vague_expression(value: str) -> Tuple[bool, str]:
     """
     모호한 표현 검증
     """
-    if pd.isna(value) or str(value).strip() == '':
+    value_str = _cell_text(value)
+    if value_str is None:
         return True, "빈 값"
 
-    value_str = str(value)
+    return _check_vague_expression(value_str)
 
-    for vague in FORBIDDEN_VAGUE:
-        # 모호한 표현이 단독으로 사용된 경우 (수치 없이)
-        if vague in value_str:
-            # 같은 줄에 숫자가 있는지 확인
-            lines = value_str.split('\n')
-            for line in lines:
-                if vague in line and not re.search(r'\d+', line):
-                    return False, f"[WARNING] 모호한 표현 '{vague}' - 구체적 수치 추가 필요"
 
-    return True, "OK"
+def _new_bucket() -> dict:
+    """열별 결과 버킷 (행 번호/사유/값 병렬 리스트 - 건마다 dict를 만들지 않음)"""
+    return {"rows": [], "reasons": [], "values": []}
 
 
 def validate_prevention_detection(file_path: str) -> dict:
@@ -387,23 +467,22 @@ def validate_prevention_detection(file_path: str) -> dict:
             "total_rows": int,
             "checked_rows": int,
             "violations": {
-                "H": [...],
-                "J": [...]
-            },
-            "warnings": {
-                "H": [...],
-                "J": [...]
+                "H": {"rows": [...], "reasons": [...], "values": [...]},
+                "J": {...}
             },
+            "warnings": {"H": {...}, "J": {...}},
+            "info": {"H": {...}, "J": {...}},
             "summary": {...}
         }
+        (열별 결과는 행 번호/사유/원본 셀 문자열 병렬 리스트 - 같은 인덱스가 한 건)
     """
     result = {
         "status": "pass",
         "total_rows": 0,
         "checked_rows": 0,
-        "violations": {"H": [], "J": []},
-        "warnings": {"H": [], "J": []},
-        "info": {"H": [], "J": []},
+        "violations": {"H": _new_bucket(), "J": _new_bucket()},
+        "warnings": {"H": _new_bucket(), "J": _new_bucket()},
+        "info": {"H": _new_bucket(), "J": _new_bucket()},
         "summary": {
             "error_count": 0,
             "warning_count": 0,
@@ -415,23 +494,20 @@ def validate_prevention_detection(file_path: str) -> dict:
     }
 
     try:
-        # FMEA 시트 읽기 (헤더 없이)
-        df = pd.read_excel(file_path, sheet_name='FMEA', header=None)
-        result["total_rows"] = len(df)
+        # FMEA 시트 앞 10행만 읽어 헤더 탐색 (헤더 없이)
+        preview = pd.read_excel(file_path, sheet_name='FMEA', header=None, nrows=10, engine=_EXCEL_ENGINE)
 
-        # 헤더 행 찾기
-        prevention_col = None  # H열
-        detection_col = None   # J열
+        # 헤더 행 찾기 (앞 10행 셀 문자열을 열 단위 str.contains로 한 번에 검사)
+        header_texts = preview.astype(str)
+        prevention_mask = header_texts.apply(
+            lambda column: column.str.contains('예방대책', regex=False, na=False)).to_numpy(dtype=bool)
+        detection_mask = header_texts.apply(
+            lambda column: column.str.contains('검출대책', regex=False, na=False)).to_numpy(dtype=bool)
+        # 한 셀에 둘 다 있으면 예방대책으로 처리
+        detection_mask = detection_mask & ~prevention_mask
 
-        for i in range(min(10, len(df))):
-            row = df.iloc[i]
-            for j, cell in enumerate(row):
-                if pd.notna(cell):
-                    cell_str = str(cell)
-                    if '현재예방대책' in cell_str or '예방대책' in cell_str:
-                        prevention_col = j
-                    elif '현재검출대책' in cell_str or '검출대책' in cell_str:
-                        detection_col = j
+        prevention_col = _last_match_col(prevention_mask)  # H열
+        detection_col = _last_match_col(detection_mask)    # J열
 
         # 헤더를 못 찾으면 기본 위치 사용 (H=7, J=9)
         if prevention_col is None:
@@ -439,38 +515,42 @@ def validate_prevention_detection(file_path: str) -> dict:
         if detection_col is None:
             detection_col = 9   # J열 (0-indexed)
 
+        # H/J 두 열만 읽기 (시트 폭을 벗어난 열은 결과에 없음, 열 이름 = 0-indexed 열 번호)
+        df = pd.read_excel(file_path, sheet_name='FMEA', header=None, engine=_EXCEL_ENGINE,
+                           usecols=lambda c: c in (prevention_col, detection_col))
+        if df.columns.empty:
+            # H/J 모두 시트 폭 밖 (좁은 시트) -> 행 수 집계를 위해 전체 읽기
+            df = pd.read_excel(file_path, sheet_name='FMEA', header=None, engine=_EXCEL_ENGINE)
+        result["total_rows"] = len(df)
+
         # 데이터 행 시작 찾기 (헤더 이후)
         data_start = 6  # 기본값 (Row 7부터)
-        for i in range(len(df)):
-            row = df.iloc[i]
-            # 단계 태그가 있는 첫 행 찾기
-            if prevention_col < len(row):
-                cell = str(row.iloc[prevention_col]) if pd.notna(row.iloc[prevention_col]) else ""
+        if prevention_col in df.columns:
+            for i, value in enumerate(df[prevention_col]):
+                # 단계 태그가 있는 첫 행 찾기
+                cell = _cell_text(value) or ""
                 if any(stage + ':' in cell for stage in REQUIRED_STAGES):
                     data_start = i
                     break
 
-        # 각 행 검증
-        for i in range(data_start, len(df)):
-            row = df.iloc[i]
-
-            # H열 (현재예방대책) 검증
-            if prevention_col < len(row):
-                h_value = row.iloc[prevention_col]
-                if pd.notna(h_value) and str(h_value).strip():
-                    result["checked_rows"] += 1
-                    _validate_cell(h_value, i + 1, "H", result)
+        # H열 (현재예방대책) / J열 (현재검출대책) 검증 - 데이터 행 열 전체를 한 번에
+        columns = {}
+        if prevention_col in df.columns:
+            columns["H"] = _column_texts(df[prevention_col].iloc[data_start:])
+            result["checked_rows"] = len(columns["H"][0])
+        if detection_col in df.columns:
+            columns["J"] = _column_texts(df[detection_col].iloc[data_start:])
 
-            # J열 (현재검출대책) 검증
-            if detection_col < len(row):
-                j_value = row.iloc[detection_col]
-                if pd.notna(j_value) and str(j_value).strip():
-                    _validate_cell(j_value, i + 1, "J", result)
+        # 두 열의 고유 문구를 모아 1회씩 검사 후 셀마다 기록
+        unique_texts = list(dict.fromkeys(chain.from_iterable(stripped for _, stripped in columns.values())))
+        issues_by_text = _compute_issues_by_text(unique_texts)
+        for col, (raw_texts, stripped) in columns.items():
+            _record_column_issues(raw_texts, stripped, issues_by_text, col, result)
 
         # 요약 집계
-        result["summary"]["error_count"] = len(result["violations"]["H"]) + len(result["violations"]["J"])
-        result["summary"]["warning_count"] = len(result["warnings"]["H"]) + len(result["warnings"]["J"])
-        result["summary"]["info_count"] = len(result["info"]["H"]) + len(result["info"]["J"])
+        result["summary"]["error_count"] = len(result["violations"]["H"]["rows"]) + len(result["violations"]["J"]["rows"])
+        result["summary"]["warning_count"] = len(result["warnings"]["H"]["rows"]) + len(result["warnings"]["J"]["rows"])
+        result["summary"]["info_count"] = len(result["info"]["H"]["rows"]) + len(result["info"]["J"]["rows"])
 
         if result["summary"]["error_count"] > 0:
             result["status"] = "fail"
@@ -479,97 +559,142 @@ def validate_prevention_detection(file_path: str) -> dict:
         return {
             "status": "error",
             "message": f"파일을 찾을 수 없습니다: {file_path}",
-            "violations": {"H": [], "J": []}
+            "violations": {"H": _new_bucket(), "J": _new_bucket()}
         }
     except Exception as e:
         return {
             "status": "error",
             "message": f"검증 중 오류 발생: {str(e)}",
-            "violations": {"H": [], "J": []}
+            "violations": {"H": _new_bucket(), "J": _new_bucket()}
         }
 
     return result
 
 
-def _validate_cell(value: str, row_num: int, col: str, result: dict):
+def _last_match_col(mask: np.ndarray):
+    """헤더 마스크에서 행 우선 순서로 마지막 True 셀의 열 번호 (없으면 None)"""
+    matched_rows = np.flatnonzero(mask.any(axis=1)) if mask.size else []
+    if not len(matched_rows):
+        return None
+    return int(np.flatnonzero(mask[matched_rows[-1]])[-1])
+
+
+def _column_texts(values: pd.Series) -> Tuple[pd.Series, pd.Series]:
+    """
+    H/J열 데이터 셀의 (원본 문자열, strip 문자열) - 빈 셀 제외
+
+    문자열 변환/strip, 빈 셀 제외는 .str 연산으로 열 단위 1회 수행
+    (object dtype 고정 - Python re 규칙 유지)
+    """
+    raw_texts = values[values.notna()].astype(str).astype(object)
+    stripped = raw_texts.str.strip()
+    nonblank = stripped != ''
+    return raw_texts[nonblank], stripped[nonblank]
+
+
+# 병렬 검사 작업 단위 고유 문구 수
+_PARALLEL_CHUNK_TEXTS = 1000
+
+# 병렬 검사 최소 고유 문구 수 (이보다 적으면 단일 프로세스로 검사)
+# 측정: 직렬 검사 약 31~36us/문구 (2000문구 63ms), spawn 워커는 pandas+온톨로지 import에 약 0.6~0.7s
+# -> 4워커 기준 손익분기 약 2만2천~3만 문구 (6000행 시트를 풀로 돌리면 0.36s -> 3.6s)
+# Windows는 spawn만 지원하므로 손익분기 상한으로 설정
+_PARALLEL_MIN_TEXTS = 30000
+
+
+def _compute_issues_chunk(texts: List[str]) -> List[list]:
+    """고유 문구 묶음의 검사 결과 (ProcessPoolExecutor 작업 단위 - 괄호 출처 추출/숫자 검색은 묶음 단위 .str 연산)"""
+    chunk = pd.Series(texts, dtype=object)
+    return [
+        _compute_cell_issues(value_str, source_matches, has_number)
+        for value_str, source_matches, has_number in zip(
+            chunk, chunk.str.findall(_PAREN_RE), chunk.str.contains(_DIGIT_RE))
+    ]
+
+
+def _compute_issues_by_text(texts: List[str]) -> Dict[str, list]:
+    """
+    고유 문구별 검사 결과
+
+    FMEA 시트는 같은 대책 문구가 여러 행에 반복되므로 검사는 고유 문구당 1회
+    고유 문구가 _PARALLEL_MIN_TEXTS 이상이고 CPU가 여러 개면 묶음 단위로 ProcessPoolExecutor에 분산
+    """
+    chunks = [texts[i:i + _PARALLEL_CHUNK_TEXTS] for i in range(0, len(texts), _PARALLEL_CHUNK_TEXTS)]
+
+    if len(texts) < _PARALLEL_MIN_TEXTS or (os.cpu_count() or 1) < 2:
+        chunk_results = map(_compute_issues_chunk, chunks)
+    else:
+        with ProcessPoolExecutor() as executor:
+            chunk_results = list(executor.map(_compute_issues_chunk, chunks))
+
+    return dict(zip(texts, chain.from_iterable(chunk_results)))
+
+
+def _record_column_issues(raw_texts: pd.Series, stripped: pd.Series, issues_by_text: Dict[str, list],
+                          col: str, result: dict):
+    """
+    H/J열 셀마다 해당 문구의 검사 결과를 행 번호와 함께 기록
+
+    값은 원본 문자열을 그대로 참조 (자르기는 보고서 출력 시에만)
     """
-    단일 셀 검증 및 결과 추가
+    summary = result["summary"]
+    for row_idx, raw_str, value_str in zip(raw_texts.index, raw_texts, stripped):
+        for kind, reason, counter in issues_by_text[value_str]:
+            bucket = result[kind][col]
+            bucket["rows"].append(row_idx + 1)
+            bucket["reasons"].append(reason)
+            bucket["values"].append(raw_str)
+            if counter:
+                summary[counter] += 1
+
+
+def _compute_cell_issues(value_str: str, source_matches: List[str],
+                         has_number: bool) -> List[Tuple[str, str, Optional[str]]]:
+    """
+    단일 셀 문구의 6개 검사 결과
+
+    _compute_issues_chunk에서 계산한 문자열/출처/숫자 여부를 6개 검사가 공유
+
+    Returns:
+        [(결과 종류 "violations"|"warnings"|"info", 사유, summary 카운터 키 또는 None), ...]
     """
     issues = []
 
     # 1. 형식 검증
-    is_valid, reason = validate_stage_format(value)
+    is_valid, reason = _check_stage_format(value_str)
     if not is_valid:
-        issues.append(("ERROR", reason))
-        result["violations"][col].append({
-            "row": row_num,
-            "value": str(value)[:100],
-            "reason": reason
-        })
+        issues.append(("violations", reason, None))
 
     # 2. 출처 검증
-    is_valid, reason, severity = validate_source_presence(value)
-    if not is_valid or severity != "OK":
-        if severity == "ERROR":
-            issues.append(("ERROR", reason))
-            result["violations"][col].append({
-                "row": row_num,
-                "value": str(value)[:100],
-                "reason": reason
-            })
-            result["summary"]["source_missing"] += 1
-        elif severity == "WARNING":
-            result["warnings"][col].append({
-                "row": row_num,
-                "value": str(value)[:100],
-                "reason": reason
-            })
-        elif severity == "INFO":
-            result["info"][col].append({
-                "row": row_num,
-                "value": str(value)[:100],
-                "reason": reason
-            })
+    is_valid, reason, severity = _check_source_presence(source_matches)
+    if severity == "ERROR":
+        issues.append(("violations", reason, "source_missing"))
+    elif severity == "WARNING":
+        issues.append(("warnings", reason, None))
+    elif severity == "INFO":
+        issues.append(("info", reason, None))
 
     # 3. 금지 패턴 검증
-    is_valid, reason = validate_forbidden_source(value)
+    is_valid, reason = _check_forbidden_source(source_matches)
     if not is_valid:
-        issues.append(("ERROR", reason))
-        result["violations"][col].append({
-            "row": row_num,
-            "value": str(value)[:100],
-            "reason": reason
-        })
-        result["summary"]["forbidden_used"] += 1
+        issues.append(("violations", reason, "forbidden_used"))
 
     # 4. 약어 검증
-    is_valid, reason = validate_abbreviation(value)
+    is_valid, reason = _check_abbreviation(value_str)
     if not is_valid:
-        result["warnings"][col].append({
-            "row": row_num,
-            "value": str(value)[:100],
-            "reason": reason
-        })
+        issues.append(("warnings", reason, None))
 
     # 5. 기준값 검증
-    is_valid, reason, severity = validate_value_presence(value)
-    if not is_valid or severity == "WARNING":
-        if severity == "WARNING":
-            result["warnings"][col].append({
-                "row": row_num,
-                "value": str(value)[:100],
-                "reason": reason
-            })
-            result["summary"]["value_missing"] += 1
+    is_valid, reason, severity = _check_value_presence(value_str, has_number)
+    if severity == "WARNING":
+        issues.append(("warnings", reason, "value_missing"))
 
     # 6. 모호한 표현 검증
-    is_valid, reason = validate_vague_expression(value)
+    is_valid, reason = _check_vague_expression(value_str)
     if not is_valid:
-        result["warnings"][col].append({
-            "row": row_num,
-            "value": str(value)[:100],
-            "reason": reason
-        })
+        issues.append(("warnings", reason, None))
+
+    return issues
 
 
 def print_validation_report(result: dict):
@@ -589,11 +714,12 @@ def print_validation_report(result: dict):
 
     for col in ["H", "J"]:
         col_name = "현재예방대책" if col == "H" else "현재검출대책"
-        violations = result.get("violations", {}).get(col, [])
-        print(f"\n  {col}열 ({col_name}): {len(violations)}건")
-        for v in violations[:10]:  # 최대 10개만 출력
-            print(f"    Row {v['row']}: {v['reason']}")
-            print(f"           값: \"{v['value'][:50]}...\"" if len(v['value']) > 50 else f"           값: \"{v['value']}\"")
+        violations = result.get("violations", {}).get(col) or _new_bucket()
+        print(f"\n  {col}열 ({col_name}): {len(violations['rows'])}건")
+        # 최대 10개만 출력
+        for row, reason, value in zip(violations["rows"][:10], violations["reasons"], violations["values"]):
+            print(f"    Row {row}: {reason}")
+            print(f"           값: \"{value[:50]}...\"" if len(value) > 50 else f"           값: \"{value}\"")
 
     # WARNING 출력
     print("\n[2] WARNINGS (수정 권장)")
@@ -601,10 +727,11 @@ def print_validation_report(result: dict):
 
     for col in ["H", "J"]:
         col_name = "현재예방대책" if col == "H" else "현재검출대책"
-        warnings = result.get("warnings", {}).get(col, [])
-        print(f"\n  {col}열 ({col_name}): {len(warnings)}건")
-        for w in warnings[:5]:  # 최대 5개만 출력
-            print(f"    Row {w['row']}: {w['reason']}")
+        warnings = result.get("warnings", {}).get(col) or _new_bucket()
+        print(f"\n  {col}열 ({col_name}): {len(warnings['rows'])}건")
+        # 최대 5개만 출력
+        for row, reason in zip(warnings["rows"][:5], warnings["reasons"]):
+            print(f"    Row {row}: {reason}")
 
     # 요약
     print("\n" + "=" * 60)
@@ -13,18 +13,68 @@ FMEA 단일 항목 사전 검증 스크립트
 """
 
 import json
-import argparse
+import re
 import sys
 import os
+from collections import Counter
+from functools import lru_cache, wraps
+from itertools import chain
 from pathlib import Path
 
+from validation_utils import build_automaton, orjson_module
+
 # 스킬 디렉토리 기준 경로
 SKILL_DIR = Path(__file__).parent.parent
 REFERENCES_DIR = SKILL_DIR / "references"
 
 
+def _compile_any(patterns: tuple) -> re.Pattern:
+    """패턴 중 하나라도 매칭되는지 1회 검색으로 판정하는 alternation 정규식 (대소문자 무시)"""
+    return re.compile("|".join(f"(?:{pattern})" for pattern in patterns), re.IGNORECASE)
+
+
+# H열 기준값 패턴 (수치 + 단위)
+_H_VALUE_RE = _compile_any((
+    r'\d+[\.,]?\d*\s*(N\.?m|kgf|MPa|kPa|bar|mm|cm|m|%|도|°C|이상|이하|이내)',
+    r'안전율\s*\d', r'SS\d+', r'\d+\s*mm', r'\d+\s*%'
+))
+
+# 숫자 존재 여부 (H열 기준값 패턴은 모두 숫자를 포함 -> 숫자 없는 값은 기준값 검색 생략)
+_DIGIT_RE = re.compile(r'\d')
+
+# H열 출처 패턴
+_H_SOURCE_RE = _compile_any((
+    r'\([A-Z\-0-9]+', r'CHECK SHEET', r'IEQT', r'SS\d+'
+))
+
+# J열 합격기준 패턴 (수치 또는 합격/불합격 표현)
+_J_CRITERIA_RE = _compile_any((
+    r'\d+[\.,]?\d*\s*(mm|%|이상|이하|이내|미만)',
+    r'합격', r'불합격', r'없음', r'확인', r'검토', r'필수'
+))
+
+# H/J열 라이프사이클 4단계 태그 (보고 순서 유지)
+_LIFECYCLE_TAGS = ("설계:", "재료:", "제작:", "시험:")
+
+# G열 단답형 금지어 (F열 원인이 잘못 들어간 경우)
+_CAUSE_KEYWORDS = frozenset((
+    "설계 오류", "재료 불량", "조립 오차", "검증 누락", "가공 불량",
+    "치수 오차", "용접 불량", "체결 불량", "인장 파괴", "피로 파괴"
+))
+
+
+def _freeze_ontology(ontology: dict) -> dict:
+    """
+    캐시 공유용 스냅샷 (리스트 -> 튜플, 호출자가 캐시된 목록을 바꾸지 못하게)
+
+    키워드는 intern - 여러 섹션/목록에 반복되는 같은 키워드를 한 객체로 공유
+    """
+    return {key: tuple(sys.intern(value) for value in values) for key, values in ontology.items()}
+
+
+@lru_cache(maxsize=1)
 def load_failure_mode_ontology():
-    """failure-mode-ontology.md에서 금지어 로드"""
+    """failure-mode-ontology.md에서 금지어 로드 (프로세스당 1회 파싱)"""
     ontology_path = REFERENCES_DIR / "failure-mode-ontology.md"
 
     ontology = {
@@ -48,7 +98,7 @@ def load_failure_mode_ontology():
             "체결력 부족", "고정력 부족", "압착력 부족", "클램핑력 부족"
         ]
         ontology["forbidden_patterns"] = ["증가", "저하", "상승", "감소"]
-        return ontology
+        return _freeze_ontology(ontology)
 
     current_section = None
     with open(ontology_path, "r", encoding="utf-8") as f:
@@ -75,11 +125,12 @@ def load_failure_mode_ontology():
                 _, values = line.split(":", 1)
                 ontology["visible_phenomena"].extend([v.strip() for v in values.split(",")])
 
-    return ontology
+    return _freeze_ontology(ontology)
 
 
+@lru_cache(maxsize=1)
 def load_effect_ontology():
-    """effect-ontology.md에서 C열 금지어 로드"""
+    """effect-ontology.md에서 C열 금지어 로드 (프로세스당 1회 파싱)"""
     ontology_path = REFERENCES_DIR / "effect-ontology.md"
 
     ontology = {
@@ -98,7 +149,7 @@ def load_effect_ontology():
             "FAT 불합격", "FAT불합격", "시험 불합격", "부적합",
             "조립불합격", "용접불합격", "외관불합격"
         ]
-        return ontology
+        return _freeze_ontology(ontology)
 
     current_section = None
     with open(ontology_path, "r", encoding="utf-8") as f:
@@ -127,7 +178,41 @@ def load_effect_ontology():
             "FAT 불합격", "불합격", "부적합"
         ]
 
-    return ontology
+    return _freeze_ontology(ontology)
+
+
+@lru_cache(maxsize=None)
+def _keyword_scanner(keywords: tuple, skip_blank: bool = False) -> tuple:
+    """
+    (Aho-Corasick 오토마톤, 키워드 alternation 정규식, 검사 대상 키워드) - 키워드 목록별 1회 컴파일
+
+    키워드가 없으면 정규식은 None
+    """
+    if skip_blank:
+        keywords = tuple(keyword for keyword in keywords if keyword and keyword.strip())
+    if not keywords:
+        return None, None, keywords
+    # 빈 문자열 키워드는 오토마톤에서 제외 (남는 키워드가 없으면 None -> alternation 정규식 사용)
+    automaton = build_automaton((keyword, keyword) for keyword in keywords if keyword)
+    return automaton, re.compile("|".join(map(re.escape, keywords))), keywords
+
+
+def _matched_keywords(keywords, value: str, skip_blank: bool = False) -> list:
+    """
+    value에 포함된 키워드 목록 (목록 순서 유지, 겹치는 키워드도 각각 보고)
+
+    오토마톤: 1회 스캔으로 포함된 키워드 집합을 구함 (빈 문자열 키워드는 항상 포함)
+    정규식: alternation 1회 스캔으로 하나도 없으면 바로 반환 - 포함된 경우만 키워드별로 확인
+    """
+    automaton, pattern, keywords = _keyword_scanner(tuple(keywords), skip_blank)
+    if not isinstance(value, str):
+        return [keyword for keyword in keywords if keyword in value]
+    if automaton is not None:
+        found = {keyword for _, keyword in automaton.iter(value)}
+        return [keyword for keyword in keywords if not keyword or keyword in found]
+    if pattern is None or not pattern.search(value):
+        return []
+    return [keyword for keyword in keywords if keyword in value]
 
 
 def validate_failure_mode(value: str, ontology: dict) -> list:
@@ -139,28 +224,25 @@ def validate_failure_mode(value: str, ontology: dict) -> list:
         return errors
 
     # 1줄만 검증 (옵션 A 3줄 구조 지원)
-    first_line = value.split("\n")[0].strip()
+    first_line = value.partition("\n")[0].strip()
 
     # 필수 태그 검증
-    has_tag = any(first_line.startswith(tag) for tag in ontology["required_tags"])
+    has_tag = first_line.startswith(tuple(ontology["required_tags"]))
     if not has_tag:
         errors.append(f"[BLOCKING] E열 태그 누락! 필수: 부족:/과도:/유해: 중 하나로 시작")
         errors.append(f"  현재값: '{first_line}'")
 
     # 메커니즘 키워드 검증
-    for keyword in ontology.get("mechanism_keywords", []):
-        if keyword and keyword.strip() and keyword in value:
-            errors.append(f"[BLOCKING] E열에 메커니즘 용어 '{keyword}' 금지! -> G열로 이동")
+    for keyword in _matched_keywords(ontology.get("mechanism_keywords", ()), value, skip_blank=True):
+        errors.append(f"[BLOCKING] E열에 메커니즘 용어 '{keyword}' 금지! -> G열로 이동")
 
     # 금지 패턴 검증
-    for pattern in ontology.get("forbidden_patterns", []):
-        if pattern in value:
-            errors.append(f"[BLOCKING] E열에 측정값 패턴 '{pattern}' 금지! (예: ~증가, ~저하)")
+    for pattern in _matched_keywords(ontology.get("forbidden_patterns", ()), value):
+        errors.append(f"[BLOCKING] E열에 측정값 패턴 '{pattern}' 금지! (예: ~증가, ~저하)")
 
     # 금지 정확 매칭 검증
-    for exact in ontology.get("forbidden_exact", []):
-        if exact in value:
-            errors.append(f"[BLOCKING] E열에 금지어 '{exact}' 발견! -> C열 또는 G열로 이동")
+    for exact in _matched_keywords(ontology.get("forbidden_exact", ()), value):
+        errors.append(f"[BLOCKING] E열에 금지어 '{exact}' 발견! -> C열 또는 G열로 이동")
 
     return errors
 
@@ -174,14 +256,12 @@ def validate_failure_effect(value: str, ontology: dict) -> list:
         return errors
 
     # 물리적 상태 검증
-    for physical in ontology.get("forbidden_physical", []):
-        if physical in value:
-            errors.append(f"[BLOCKING] C열에 물리적 상태 '{physical}' 금지! -> E열로 이동")
+    for physical in _matched_keywords(ontology.get("forbidden_physical", ()), value):
+        errors.append(f"[BLOCKING] C열에 물리적 상태 '{physical}' 금지! -> E열로 이동")
 
     # 검사/판정 결과 검증
-    for result in ontology.get("forbidden_results", []):
-        if result in value:
-            errors.append(f"[BLOCKING] C열에 검사결과 '{result}' 금지! -> 기술적 영향으로 변경")
+    for result in _matched_keywords(ontology.get("forbidden_results", ()), value):
+        errors.append(f"[BLOCKING] C열에 검사결과 '{result}' 금지! -> 기술적 영향으로 변경")
 
     return errors
 
@@ -200,15 +280,11 @@ def validate_mechanism(value: str) -> list:
         errors.append(f"  현재값: '{value}'")
         errors.append(f"  예시: '절연 코팅 열화 -> 층간 단락 -> 와전류 증가'")
 
-    # 단답형 금지어 (F열 원인이 잘못 들어간 경우)
-    cause_keywords = [
-        "설계 오류", "재료 불량", "조립 오차", "검증 누락", "가공 불량",
-        "치수 오차", "용접 불량", "체결 불량", "인장 파괴", "피로 파괴"
-    ]
-    for keyword in cause_keywords:
-        if value == keyword or value.strip() == keyword:
-            errors.append(f"[BLOCKING] G열에 원인 용어 '{keyword}' 금지! -> F열로 이동")
-            errors.append(f"  G열은 메커니즘 체인: '원인 상태 -> 물리적 과정 -> 결과 상태'")
+    # 단답형 금지어 (F열 원인이 잘못 들어간 경우) - 값 전체 일치이므로 집합 조회 1회
+    keyword = value.strip()
+    if keyword in _CAUSE_KEYWORDS:
+        errors.append(f"[BLOCKING] G열에 원인 용어 '{keyword}' 금지! -> F열로 이동")
+        errors.append(f"  G열은 메커니즘 체인: '원인 상태 -> 물리적 과정 -> 결과 상태'")
 
     return errors
 
@@ -220,15 +296,53 @@ def validate_lifecycle_tag(value: str, column_name: str) -> list:
     if not value:
         return errors  # 빈 값은 WARNING이지만 여기서는 skip
 
-    required_tags = ["설계:", "재료:", "제작:", "시험:"]
-    has_tag = any(value.startswith(tag) for tag in required_tags)
-
-    if not has_tag:
+    if not value.startswith(_LIFECYCLE_TAGS):
         errors.append(f"[WARNING] {column_name}에 라이프사이클 태그 권장: 설계:/재료:/제작:/시험:")
 
     return errors
 
 
+def _found_lifecycle_tags(value: str) -> list:
+    """
+    값에 포함된 라이프사이클 태그 (태그 순서)
+
+    태그에는 공백/줄바꿈이 없으므로 줄 단위 검사와 전체 문자열 검사 결과가 같음
+    -> 줄마다 훑지 않고 태그당 1회 검색
+    """
+    return [tag for tag in _LIFECYCLE_TAGS if tag in value]
+
+
+def _scan_multiline(value: str, patterns: tuple) -> tuple:
+    """
+    H/J열 멀티라인 값 스캔: (비어있지 않은 줄 수, 발견 태그, 패턴별 포함 여부)
+
+    패턴은 열 단위 alternation 1개씩 전체 문자열에 검색
+    (수치-단위 사이 공백 패턴이 줄바꿈도 허용하므로 줄 단위로 나누어 검색하지 않음)
+    """
+    line_count = sum(1 for line in value.split("\n") if line.strip())
+    return line_count, _found_lifecycle_tags(value), [bool(pattern.search(value)) for pattern in patterns]
+
+
+def _memoize_by_value(validate):
+    """
+    H/J열 검증 결과를 값(문자열)별로 메모이제이션 - 같은 대책 문구가 여러 항목에 반복됨
+
+    캐시에는 튜플로 보관하고 호출자에게는 새 리스트 반환 (캐시 오염 방지)
+    문자열이 아닌 값은 캐시 없이 그대로 검증
+    """
+    cached = lru_cache(maxsize=4096)(lambda value: tuple(validate(value)))
+
+    @wraps(validate)
+    def wrapper(value):
+        if isinstance(value, str):
+            return list(cached(value))
+        return validate(value)
+
+    wrapper.cache_clear = cached.cache_clear
+    return wrapper
+
+
+@_memoize_by_value
 def validate_prevention_multiline(value: str) -> list:
     """H열 (현재예방대책) 멀티라인 + 기준값 검증 - CRITICAL-3 규칙"""
     errors = []
@@ -237,11 +351,12 @@ def validate_prevention_multiline(value: str) -> list:
         errors.append("[BLOCKING] H열(현재예방대책) 비어있음")
         return errors
 
-    lines = [line.strip() for line in value.split("\n") if line.strip()]
+    line_count, found_tags, (has_source,) = _scan_multiline(value, (_H_SOURCE_RE,))
+    has_value = _DIGIT_RE.search(value) is not None and _H_VALUE_RE.search(value) is not None
 
     # 1. 멀티라인 검증 (4줄 이상 필수)
-    if len(lines) < 4:
-        errors.append(f"[BLOCKING] H열 멀티라인 필수! 4줄 이상 필요 (현재: {len(lines)}줄)")
+    if line_count < 4:
+        errors.append(f"[BLOCKING] H열 멀티라인 필수! 4줄 이상 필요 (현재: {line_count}줄)")
         errors.append("  형식: 설계/재료/제작/시험 4단계별 대책 + 세부항목")
         errors.append("  예시:")
         errors.append("    설계: 클램프 강도 설계 검토 (중신 CHECK SHEET)")
@@ -250,32 +365,23 @@ def validate_prevention_multiline(value: str) -> list:
         errors.append("    - 재질증명서 확인: SS400 이상")
 
     # 2. 라이프사이클 4단계 중 최소 2개 포함 검증
-    lifecycle_tags = ["설계:", "재료:", "제작:", "시험:"]
-    found_tags = [tag for tag in lifecycle_tags if any(tag in line for line in lines)]
     if len(found_tags) < 2:
         errors.append(f"[BLOCKING] H열 라이프사이클 태그 부족! 4단계 중 2개 이상 필요")
         errors.append(f"  발견된 태그: {found_tags if found_tags else '없음'}")
         errors.append(f"  필수 태그: 설계:, 재료:, 제작:, 시험:")
 
     # 3. 기준값 존재 검증 (수치 + 단위)
-    value_patterns = [
-        r'\d+[\.,]?\d*\s*(N\.?m|kgf|MPa|kPa|bar|mm|cm|m|%|도|°C|이상|이하|이내)',
-        r'안전율\s*\d', r'SS\d+', r'\d+\s*mm', r'\d+\s*%'
-    ]
-    import re
-    has_value = any(re.search(pattern, value, re.IGNORECASE) for pattern in value_patterns)
     if not has_value:
         errors.append("[WARNING] H열 기준값 권장! 정량적 수치(안전율, mm, %, N.m 등) 포함 필요")
 
     # 4. 출처 존재 검증
-    source_patterns = [r'\([A-Z\-0-9]+', r'CHECK SHEET', r'IEQT', r'SS\d+']
-    has_source = any(re.search(pattern, value, re.IGNORECASE) for pattern in source_patterns)
     if not has_source:
         errors.append("[WARNING] H열 출처 권장! (IEQT-T-W030, CHECK SHEET 등) 포함 필요")
 
     return errors
 
 
+@_memoize_by_value
 def validate_detection_multiline(value: str) -> list:
     """J열 (현재검출대책) 멀티라인 + 합격기준 검증 - CRITICAL-3 규칙"""
     errors = []
@@ -284,11 +390,11 @@ def validate_detection_multiline(value: str) -> list:
         errors.append("[BLOCKING] J열(현재검출대책) 비어있음")
         return errors
 
-    lines = [line.strip() for line in value.split("\n") if line.strip()]
+    line_count, found_tags, (has_criteria,) = _scan_multiline(value, (_J_CRITERIA_RE,))
 
     # 1. 멀티라인 검증 (4줄 이상 필수)
-    if len(lines) < 4:
-        errors.append(f"[BLOCKING] J열 멀티라인 필수! 4줄 이상 필요 (현재: {len(lines)}줄)")
+    if line_count < 4:
+        errors.append(f"[BLOCKING] J열 멀티라인 필수! 4줄 이상 필요 (현재: {line_count}줄)")
         errors.append("  형식: 설계/재료/제작/시험 4단계별 검출방법 + 합격기준")
         errors.append("  예시:")
         errors.append("    설계: 도면 승인 (설계팀)")
@@ -297,20 +403,12 @@ def validate_detection_multiline(value: str) -> list:
         errors.append("    - 비드 외관: 크랙/언더컷 없음")
 
     # 2. 라이프사이클 4단계 중 최소 2개 포함 검증
-    lifecycle_tags = ["설계:", "재료:", "제작:", "시험:"]
-    found_tags = [tag for tag in lifecycle_tags if any(tag in line for line in lines)]
     if len(found_tags) < 2:
         errors.append(f"[BLOCKING] J열 라이프사이클 태그 부족! 4단계 중 2개 이상 필요")
         errors.append(f"  발견된 태그: {found_tags if found_tags else '없음'}")
         errors.append(f"  필수 태그: 설계:, 재료:, 제작:, 시험:")
 
     # 3. 합격기준 존재 검증 (수치 또는 합격/불합격 표현)
-    import re
-    criteria_patterns = [
-        r'\d+[\.,]?\d*\s*(mm|%|이상|이하|이내|미만)',
-        r'합격', r'불합격', r'없음', r'확인', r'검토', r'필수'
-    ]
-    has_criteria = any(re.search(pattern, value, re.IGNORECASE) for pattern in criteria_patterns)
     if not has_criteria:
         errors.append("[WARNING] J열 합격기준 권장! (크랙 없음, 2mm 이하 등) 포함 필요")
 
@@ -321,35 +419,27 @@ def validate_diamond_structure(items: list) -> list:
     """다이아몬드 구조 검증 (형태당 원인 2개 이상)"""
     errors = []
 
-    # 기능-고장형태별 원인 수 집계
-    function_mode_causes = {}
-
-    for item in items:
-        func = item.get("기능", "")
-        mode = item.get("고장형태", "")
-        key = f"{func}|{mode}"
-
-        if key not in function_mode_causes:
-            function_mode_causes[key] = []
-        function_mode_causes[key].append(item.get("고장원인", ""))
+    # 기능-고장형태별 원인 수 집계 (튜플 키 - 문자열 결합/분리 없음)
+    function_mode_causes = Counter((item.get("기능", ""), item.get("고장형태", "")) for item in items)
 
     # 원인 2개 미만 검출
-    for key, causes in function_mode_causes.items():
-        if len(causes) < 2:
-            func, mode = key.split("|", 1)
+    for (func, mode), cause_count in function_mode_causes.items():
+        if cause_count < 2:
             errors.append(f"[BLOCKING] 다이아몬드 구조 위반! 형태당 원인 2개 이상 필요")
             errors.append(f"  기능: '{func[:30]}...'")
             errors.append(f"  고장형태: '{mode[:30]}...'")
-            errors.append(f"  현재 원인: {len(causes)}개")
+            errors.append(f"  현재 원인: {cause_count}개")
 
     return errors
 
 
 def validate_single_item(item: dict) -> dict:
     """단일 FMEA 항목 검증"""
-    fm_ontology = load_failure_mode_ontology()
-    effect_ontology = load_effect_ontology()
+    return _validate_single_item(item, load_failure_mode_ontology(), load_effect_ontology())
+
 
+def _validate_single_item(item: dict, fm_ontology: dict, effect_ontology: dict) -> dict:
+    """단일 FMEA 항목 검증 본체 (온톨로지는 호출자가 미리 로드해 전달)"""
     result = {
         "valid": True,
         "errors": [],
@@ -394,10 +484,50 @@ def validate_single_item(item: dict) -> dict:
     return result
 
 
+def _parse_json(text):
+    """
+    JSON 문자열/바이트 디코드 (orjson 설치 시 사용)
+
+    NaN/Infinity, 64비트 초과 정수 등 orjson이 거부하는 표기는 json으로 재시도
+    """
+    orjson = orjson_module()
+    if orjson is not None:
+        try:
+            return orjson.loads(text)
+        except orjson.JSONDecodeError:
+            pass
+    if isinstance(text, bytes):
+        text = text.decode("utf-8")
+    return json.loads(text)
+
+
+def _load_json(json_path: str):
+    """JSON 파일 로드 (orjson 설치 시 바이트를 그대로 디코드)"""
+    if orjson_module() is not None:
+        return _parse_json(Path(json_path).read_bytes())
+    with open(json_path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+# 병렬 검증 작업 단위 항목 수
+_PARALLEL_CHUNK_ITEMS = 1000
+
+# 병렬 검증 최소 항목 수 (이보다 적으면 단일 프로세스로 검증)
+# 측정: 직렬 검증 약 42~72us/항목 (2400항목 0.10s), spawn 풀 기동 약 0.5s (2400항목 0.58s)
+# -> 4워커 기준 손익분기 약 1만~1만8천 항목, Windows(spawn 전용) 기준 상한으로 설정
+_PARALLEL_MIN_ITEMS = 20000
+
+
+def _validate_chunk(chunk: list) -> list:
+    """항목 묶음 검증 (ProcessPoolExecutor 작업 단위 - 온톨로지는 묶음마다 1회 조회)"""
+    fm_ontology = load_failure_mode_ontology()
+    effect_ontology = load_effect_ontology()
+    return [_validate_single_item(item, fm_ontology, effect_ontology) for item in chunk]
+
+
 def validate_json_file(json_path: str, index: int = None) -> dict:
     """JSON 파일에서 항목 검증"""
-    with open(json_path, "r", encoding="utf-8") as f:
-        data = json.load(f)
+    data = _load_json(json_path)
 
     # fmea_data 구조 처리
     items = data.get("fmea_data", data.get("items", data))
@@ -410,12 +540,20 @@ def validate_json_file(json_path: str, index: int = None) -> dict:
         else:
             return {"valid": False, "errors": [f"인덱스 {index}가 범위를 벗어남 (총 {len(items)}개)"], "warnings": []}
 
-    # 전체 검증
+    # 전체 검증 (_PARALLEL_MIN_ITEMS 이상이면 ProcessPoolExecutor로 분산, 결과는 입력 순서 유지)
+    chunks = [items[start:start + _PARALLEL_CHUNK_ITEMS] for start in range(0, len(items), _PARALLEL_CHUNK_ITEMS)]
+    if len(items) < _PARALLEL_MIN_ITEMS or (os.cpu_count() or 1) < 2:
+        chunk_results = map(_validate_chunk, chunks)
+    else:
+        # 병렬 경로에서만 필요 - 단일 항목 CLI 기동 시 import 비용 제외
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor() as executor:
+            chunk_results = list(executor.map(_validate_chunk, chunks))
+
     all_errors = []
     all_warnings = []
 
-    for i, item in enumerate(items):
-        result = validate_single_item(item)
+    for i, result in enumerate(chain.from_iterable(chunk_results)):
         if result["errors"]:
             all_errors.append(f"\n[항목 {i+1}]")
             all_errors.extend(result["errors"])
@@ -438,6 +576,8 @@ def validate_json_file(json_path: str, index: int = None) -> dict:
 
 
 def main():
+    import argparse
+
     parser = argparse.ArgumentParser(description="FMEA 단일 항목 사전 검증")
     parser.add_argument("--item", type=str, help="JSON 형식 단일 항목")
     parser.add_argument("--json", type=str, help="JSON 파일 경로")
@@ -447,7 +587,7 @@ def main():
     args = parser.parse_args()
 
     if args.item:
-        item = json.loads(args.item)
+        item = _parse_json(args.item)
         result = validate_single_item(item)
     elif args.json:
         result = validate_json_file(args.json, args.index)
@@ -0,0 +1,117 @@
+# -*- coding: utf-8 -*-
+"""
+검증 스크립트 공통 유틸리티
+온톨로지 파싱 캐시, Aho-Corasick 오토마톤, JSON 결과 출력
+
+사용법:
+    from validation_utils import load_pickle_cache, save_pickle_cache
+    from validation_utils import build_automaton, dumps_json, write_json
+
+[!] import 시 stdout을 건드리지 않음 (encoding_utils와 달리 라이브러리 import에 안전)
+"""
+
+import sys
+import json
+import pickle
+from functools import lru_cache
+from pathlib import Path
+from typing import Any, Iterable, Optional, Tuple
+
+# Aho-Corasick (선택): 설치 시 다중 키워드를 단일 오토마톤으로 1회 스캔
+try:
+    import ahocorasick
+except ImportError:
+    ahocorasick = None
+
+
+# ============================================================================
+# 온톨로지 파싱 캐시 (pickle)
+# ============================================================================
+
+def _source_signature(source_path: Path) -> Tuple[int, int]:
+    """원본 파일 식별 정보 (st_mtime_ns, st_size)"""
+    stat = source_path.stat()
+    return stat.st_mtime_ns, stat.st_size
+
+
+def load_pickle_cache(source_path: Path, cache_path: Path, version: int) -> Optional[Any]:
+    """
+    파싱 캐시 로드 (형식 버전 또는 원본 mtime_ns/크기가 저장 당시와 다르거나 손상 시 None)
+
+    mtime 대소 비교가 아닌 정확 일치로 판단 - cp -p, rsync -t, 압축 해제로
+    더 오래된 mtime의 원본이 들어와도 캐시를 신뢰하지 않음
+    """
+    try:
+        cached_version, signature, cached = pickle.loads(cache_path.read_bytes())
+        if cached_version != version or signature != _source_signature(source_path):
+            return None
+    except Exception:
+        # 캐시 없음/손상 -> 원본 재파싱
+        return None
+
+    return cached
+
+
+def save_pickle_cache(source_path: Path, cache_path: Path, version: int, data: Any):
+    """파싱 결과를 원본 식별 정보와 함께 캐시 파일로 저장 (쓰기 실패 시 무시)"""
+    try:
+        signature = _source_signature(source_path)
+        cache_path.write_bytes(pickle.dumps((version, signature, data), protocol=5))
+    except OSError:
+        pass
+
+
+# ============================================================================
+# Aho-Corasick 오토마톤
+# ============================================================================
+
+def build_automaton(entries: Iterable[Tuple[str, Any]]):
+    """
+    (키워드, 값) 목록을 단일 Aho-Corasick 오토마톤으로 컴파일
+
+    pyahocorasick 미설치 또는 키워드가 없으면 None -> 호출 측의 부분 문자열/정규식 검사 사용
+    """
+    if ahocorasick is None:
+        return None
+
+    automaton = ahocorasick.Automaton()
+    for keyword, value in entries:
+        automaton.add_word(keyword, value)
+    if len(automaton) == 0:
+        return None
+    automaton.make_automaton()
+    return automaton
+
+
+# ============================================================================
+# JSON 결과 출력
+# ============================================================================
+
+@lru_cache(maxsize=1)
+def orjson_module():
+    """orjson 모듈 (선택 - CLI 기동 시간 단축을 위해 첫 사용 때 import, 미설치 시 None)"""
+    try:
+        import orjson
+    except ImportError:
+        return None
+    return orjson
+
+
+def dumps_json(obj) -> str:
+    """JSON 직렬화 (orjson 설치 시 사용, 한글은 이스케이프 없이 출력)"""
+    orjson = orjson_module()
+    if orjson is not None:
+        return orjson.dumps(obj, option=orjson.OPT_INDENT_2).decode('utf-8')
+    return json.dumps(obj, ensure_ascii=False, indent=2)
+
+
+def write_json(obj):
+    """JSON 결과를 문자열로 모으지 않고 stdout에 바로 출력 (orjson 설치 시 바이트로 직접 기록)"""
+    orjson = orjson_module()
+    if orjson is not None:
+        sys.stdout.flush()
+        sys.stdout.buffer.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_APPEND_NEWLINE))
+        sys.stdout.buffer.flush()
+    else:
+        json.dump(obj, sys.stdout, ensure_ascii=False, indent=2)
+        sys.stdout.write('\n')